@@ -1,6 +1,8 @@
 from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
 from conan.tools.files import copy, get
 from conan.tools.layout import basic_layout
+from conan.tools.scm import Version
 import os
 
 required_conan_version = ">=1.50.0"
@@ -16,14 +18,36 @@ class Asio(ConanFile):
 
     package_type = "header-library"
     settings = "os", "arch", "compiler", "build_type"
+    options = {
+        "with_io_uring": [True, False],
+        "disable_epoll": [True, False],
+    }
+    default_options = {
+        "with_io_uring": False,
+        "disable_epoll": False,
+    }
     no_copy_source = True
 
+    def config_options(self):
+        # io_uring support was added in asio 1.21.0
+        if self.settings.os != "Linux" or Version(self.version) < "1.21.0":
+            del self.options.with_io_uring
+            del self.options.disable_epoll
+
     def layout(self):
         basic_layout(self, src_folder="src")
 
+    def requirements(self):
+        if self.options.get_safe("with_io_uring"):
+            self.requires("liburing/2.11")
+
     def package_id(self):
         self.info.clear()
 
+    def validate(self):
+        if self.options.get_safe("disable_epoll") and not self.options.with_io_uring:
+            raise ConanInvalidConfiguration("disable_epoll=True requires with_io_uring=True, otherwise no reactor is left on Linux")
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
 
@@ -40,6 +64,11 @@ class Asio(ConanFile):
     def package_info(self):
         self.cpp_info.set_property("pkg_config_name", "asio")
         self.cpp_info.defines.append("ASIO_STANDALONE")
+        if self.options.get_safe("with_io_uring"):
+            self.cpp_info.defines.append("ASIO_HAS_IO_URING")
+            if self.options.disable_epoll:
+                # io_uring is then used for sockets as well, not only for files
+                self.cpp_info.defines.append("ASIO_DISABLE_EPOLL")
         self.cpp_info.bindirs = []
         self.cpp_info.frameworkdirs = []
         self.cpp_info.libdirs = []
@@ -1,12 +1,12 @@
 from conan import ConanFile
 from conan.tools.build import can_run
-from conan.tools.cmake import CMake, cmake_layout
+from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 import os
 
 
 class TestPackageConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
-    generators = "CMakeToolchain", "CMakeDeps", "VirtualRunEnv"
+    generators = "CMakeDeps", "VirtualRunEnv"
 
     def requirements(self):
         self.requires(self.tested_reference_str)
@@ -14,6 +14,15 @@ class TestPackageConan(ConanFile):
     def layout(self):
         cmake_layout(self)
 
+    @property
+    def _with_io_uring(self):
+        return bool(self.dependencies["asio"].options.get_safe("with_io_uring"))
+
+    def generate(self):
+        tc = CMakeToolchain(self)
+        tc.cache_variables["WITH_IO_URING"] = self._with_io_uring
+        tc.generate()
+
     def build(self):
         cmake = CMake(self)
         cmake.configure()
@@ -23,3 +32,6 @@ class TestPackageConan(ConanFile):
         if can_run(self):
             bin_path = os.path.join(self.cpp.build.bindirs[0], "test_package")
             self.run(bin_path, env="conanrun")
+            if self._with_io_uring:
+                bin_path = os.path.join(self.cpp.build.bindirs[0], "test_io_uring")
+                self.run(bin_path, env="conanrun")
@@ -0,0 +1,39 @@
+#include <asio.hpp>
+
+#include <cstdio>
+#include <exception>
+#include <fstream>
+#include <iostream>
+#include <string>
+
+int main()
+{
+	const char *path = "asio_io_uring_test.txt";
+	const std::string expected = "io_uring";
+	{
+		std::ofstream out(path);
+		out << expected;
+	}
+
+	std::string data(expected.size(), '\0');
+	std::size_t bytes_read = 0;
+	try {
+		asio::io_context context;
+		asio::stream_file file(context, path, asio::stream_file::read_only);
+		asio::async_read(file, asio::buffer(&data[0], data.size()),
+			[&](const asio::error_code &ec, std::size_t n) {
+				if (!ec)
+					bytes_read = n;
+			});
+		context.run();
+	} catch (const std::exception &e) {
+		// e.g. io_uring disabled by the kernel or a seccomp profile
+		std::cout << "io_uring not available at runtime: " << e.what() << std::endl;
+		std::remove(path);
+		return 0;
+	}
+	std::remove(path);
+
+	std::cout << "read " << bytes_read << " bytes through io_uring" << std::endl;
+	return bytes_read == expected.size() && data == expected ? 0 : 1;
+}
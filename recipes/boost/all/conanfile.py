@@ -80,6 +80,8 @@ class BoostConan(ConanFile):
         "error_code_header_only": [True, False],
         "system_no_deprecated": [True, False],
         "asio_no_deprecated": [True, False],
+        "with_io_uring": [True, False],
+        "asio_disable_epoll": [True, False],
         "filesystem_no_deprecated": [True, False],
         "filesystem_use_std_fs": [True, False],
         "filesystem_version": [None, "3", "4"],
@@ -119,6 +121,8 @@ class BoostConan(ConanFile):
         "error_code_header_only": False,
         "system_no_deprecated": False,
         "asio_no_deprecated": False,
+        "with_io_uring": False,
+        "asio_disable_epoll": False,
         "filesystem_no_deprecated": False,
         "filesystem_use_std_fs": False,
         "filesystem_version": None,
@@ -410,6 +414,11 @@ class BoostConan(ConanFile):
         if self.settings.os == "Windows":
             del self.options.with_stacktrace_backtrace
 
+        # io_uring is a Linux kernel interface
+        if self.settings.os != "Linux":
+            del self.options.with_io_uring
+            del self.options.asio_disable_epoll
+
         # nowide requires a c++11-able compiler + movable std::fstream: change default to not build on compiler with too old default c++ standard or too low compiler.cppstd
         # json requires a c++11-able compiler: change default to not build on compiler with too old default c++ standard or too low compiler.cppstd
         if self.settings.compiler.get_safe("cppstd"):
@@ -735,6 +744,9 @@ class BoostConan(ConanFile):
                 "Boost.Locale library needs either iconv or ICU library to be built on non windows platforms"
             )
 
+        if self.options.get_safe("asio_disable_epoll") and not self._with_io_uring:
+            raise ConanInvalidConfiguration("asio_disable_epoll=True requires with_io_uring=True, otherwise no reactor is left on Linux")
+
         if self._stacktrace_addr2line_available:
             if not os.path.isabs(str(self.options.addr2line_location)):
                 raise ConanInvalidConfiguration("addr2line_location must be an absolute path to addr2line")
@@ -809,6 +821,10 @@ class BoostConan(ConanFile):
     def _with_stacktrace_backtrace(self):
         return not self.options.header_only and self.options.get_safe("with_stacktrace_backtrace", False)
 
+    @property
+    def _with_io_uring(self):
+        return self.options.get_safe("with_io_uring", False)
+
     def requirements(self):
         if self._with_zlib:
             self.requires("zlib/[>=1.2.11 <2]")
@@ -820,6 +836,9 @@ class BoostConan(ConanFile):
             self.requires("zstd/[>=1.5 <1.6]")
         if self._with_stacktrace_backtrace:
             self.requires("libbacktrace/cci.20210118", transitive_headers=True, transitive_libs=True)
+        if self._with_io_uring:
+            # Boost.Asio includes liburing.h when BOOST_ASIO_HAS_IO_URING is defined
+            self.requires("liburing/2.11", transitive_headers=True, transitive_libs=True)
 
         if self._with_icu:
             self.requires("icu/74.2")
@@ -1374,6 +1393,15 @@ class BoostConan(ConanFile):
             flags.append("define=BOOST_SYSTEM_NO_DEPRECATED=1")
         if self.options.asio_no_deprecated:
             flags.append("define=BOOST_ASIO_NO_DEPRECATED=1")
+        if self._with_io_uring:
+            # Compiled libraries using Asio (cobalt, process) must see the same io_context implementation
+            flags.append("define=BOOST_ASIO_HAS_IO_URING=1")
+            if self.options.asio_disable_epoll:
+                flags.append("define=BOOST_ASIO_DISABLE_EPOLL=1")
+            liburing_cpp_info = self.dependencies["liburing"].cpp_info.aggregated_components()
+            cxx_flags.extend(f"-I{d}" for d in liburing_cpp_info.includedirs)
+            link_flags.extend(f"-L{d}" for d in liburing_cpp_info.libdirs)
+            link_flags.extend(f"-l{l}" for l in liburing_cpp_info.libs)
         if self.options.filesystem_no_deprecated:
             flags.append("define=BOOST_FILESYSTEM_NO_DEPRECATED=1")
         if self.options.filesystem_use_std_fs:
@@ -1766,6 +1794,12 @@ class BoostConan(ConanFile):
         if self.options.asio_no_deprecated:
             self.cpp_info.components["headers"].defines.append("BOOST_ASIO_NO_DEPRECATED")
 
+        if self._with_io_uring:
+            self.cpp_info.components["headers"].defines.append("BOOST_ASIO_HAS_IO_URING")
+            if self.options.asio_disable_epoll:
+                self.cpp_info.components["headers"].defines.append("BOOST_ASIO_DISABLE_EPOLL")
+            self.cpp_info.components["headers"].requires.append("liburing::liburing")
+
         if self.options.filesystem_no_deprecated:
             self.cpp_info.components["headers"].defines.append("BOOST_FILESYSTEM_NO_DEPRECATED")
 
@@ -4,12 +4,15 @@ import argparse
 import dataclasses
 import json
 import logging
+import os
 import pprint
 import re
 import subprocess
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 from conan.tools.files import chdir
@@ -103,22 +106,75 @@ class BoostDependenciesExport(object):
 class BoostDependencies(object):
     buildables: List[str]
     export: BoostDependenciesExport
+    components: Dict[str, Dict[str, Any]] = dataclasses.field(default_factory=dict)
+
+
+def _analyze_component(boost_path: Path, component: str) -> Dict[str, Any]:
+    # Module level function, such that it can be run in a process pool
+    return {
+        "requirements": BoostDependencyBuilder._grep_requirements(boost_path, component),
+        "libraries": BoostDependencyBuilder._grep_jam_libraries(boost_path, component),
+    }
 
 
 class BoostDependencyBuilder(object):
-    def __init__(self, boost_version: str, boostdep_version: str, tmppath: Path, git_url: str, outputdir: Path, unsafe: bool):
+    def __init__(self, boost_version: str, boostdep_version: str, tmppath: Path, git_url: str, outputdir: Path, unsafe: bool,
+                 cachedir: Optional[Path] = None, jobs: Optional[int] = None):
         self.boost_version = boost_version
         self.boostdep_version = boostdep_version
         self.git_url = git_url
         self.tmppath = tmppath
         self.outputdir = outputdir
         self.unsafe = unsafe
+        self.cachedir = cachedir
+        self.jobs = jobs
         self._boostdep = None
+        self._cache = {}
 
     @property
     def boost_path(self) -> Path:
         return self.tmppath / "boost"
 
+    @property
+    def boost_tag(self) -> str:
+        return f"boost-{self.boost_version}"
+
+    @property
+    def _cachepath(self) -> Optional[Path]:
+        if not self.cachedir:
+            return None
+        return self.cachedir / f"{self.boost_tag}.json"
+
+    def _tag_commit(self) -> str:
+        with chdir(self, self.boost_path):
+            return subprocess.check_output(["git", "rev-parse", "--verify", f"{self.boost_tag}^{{commit}}"], text=True).strip()
+
+    def load_cache(self) -> bool:
+        """
+        Load the results of a previous run for this boost tag.
+        Returns True if they are complete, so the git checkout and boostdep can be skipped.
+        """
+        self._cache = {
+            "commit": self._tag_commit(),
+            "boostdep_version": self.boostdep_version,
+            "unsafe": self.unsafe,
+        }
+        if not self._cachepath or not self._cachepath.is_file():
+            return False
+        data = json.loads(self._cachepath.read_text())
+        if any(data.get(key) != value for key, value in self._cache.items()):
+            log.info("Ignoring outdated cache %s", self._cachepath)
+            return False
+        self._cache = data
+        buildables = data.get("buildables")
+        return buildables is not None and all(b in data.get("components", {}) for b in buildables)
+
+    def save_cache(self) -> None:
+        if not self._cachepath:
+            return
+        self.cachedir.mkdir(parents=True, exist_ok=True)
+        self._cachepath.write_text(json.dumps(self._cache, indent=1, sort_keys=True))
+
     def do_git_update(self) -> None:
         if not self.boost_path.exists():
             with chdir(self, self.tmppath):
@@ -189,21 +245,45 @@ class BoostDependencyBuilder(object):
             res.add(l)
         return list(res)
 
-    def _grep_requirements(self, component: str) -> List[str]:
-        jam = self.boost_path / "libs" / component / "build" / "Jamfile.v2"
+    @classmethod
+    def _grep_requirements(cls, boost_path: Path, component: str) -> Optional[List[str]]:
+        jam = boost_path / "libs" / component / "build" / "Jamfile.v2"
         if not jam.is_file():
-            jam = self.boost_path / "libs" / component / "build" / "Jamfile"
+            jam = boost_path / "libs" / component / "build" / "Jamfile"
         if not jam.is_file():
-            log.warning("Can't find Jamfile for %s. Unable to determine dependencies.", component)
-            return []
+            return None
         contents = jam.open().read()
 
-        using = self._grep_libs("\n(.*)using\\s+([^ ;:]+)\\s*", contents)
-        libs = self._grep_libs("\n(.*)\\s(?:searched-)?lib\\s+([^ \t\n;:]+)", contents)
+        using = cls._grep_libs("\n(.*)using\\s+([^ ;:]+)\\s*", contents)
+        libs = cls._grep_libs("\n(.*)\\s(?:searched-)?lib\\s+([^ \t\n;:]+)", contents)
 
-        requirements = using + libs
+        requirements = sorted(using + libs)
         return requirements
 
+    @staticmethod
+    def _grep_jam_libraries(boost_path: Path, buildable: str) -> Optional[List[str]]:
+        #  Look for the names of libraries in Jam build files
+        construct_jam = lambda jam_ext : boost_path / "libs" / buildable / "build" / f"Jamfile{jam_ext}"
+        try:
+            buildable_jam = next(construct_jam(jam_ext) for jam_ext in ("", ".v2") if construct_jam(jam_ext).is_file())
+        except StopIteration:
+            return None
+        jam_text = buildable_jam.read_text()
+        buildable_libs = re.findall("[ \n](boost-)?lib ([a-zA-Z0-9_]+)[ \n]", jam_text)
+        buildable_libs = set(f"boost_{lib}" if lib_prefix else lib for lib_prefix, lib in buildable_libs)
+        buildable_libs = set(l[len("boost_"):] for l in buildable_libs if l.startswith("boost_"))  # list(filter(lambda l: l.startswith("boost"), buildable_libs))
+        return sorted(buildable_libs)
+
+    def _analyze_components(self, components: List[str]) -> Dict[str, Dict[str, Any]]:
+        cached = self._cache.setdefault("components", {})
+        missing = [c for c in components if c not in cached]
+        if missing:
+            print(f"Analyzing {len(missing)} components of {self.boost_tag}")
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                for component, result in zip(missing, executor.map(_analyze_component, repeat(self.boost_path), missing)):
+                    cached[component] = result
+        return {c: cached[c] for c in components}
+
     def _sort_requirements(self, requirements: List[str]) -> Tuple[List[str], Dict[str, List[str]], List[str]]:
         conan_requirements = set()
         system_libs = {}
@@ -226,7 +306,7 @@ class BoostDependencyBuilder(object):
             unknown_libs.add(req)
         return list(conan_requirements), system_libs, list(unknown_libs)
 
-    def do_boostdep_collect(self) -> BoostDependencies:
+    def _run_boostdep(self) -> Tuple[List[str], Dict[str, List[str]]]:
         with chdir(self, self.boost_path):
             buildables = subprocess.check_output([self._boostdep, "--list-buildable"], text=True)
             buildables = buildables.splitlines()
@@ -251,6 +331,16 @@ class BoostDependencyBuilder(object):
             log.debug("Using `boostdep --track-sources`, the following dependency tree was calculated:")
             log.debug(pprint.pformat(dependency_tree))
 
+        return buildables, dependency_tree
+
+    def do_boostdep_collect(self) -> BoostDependencies:
+        if "buildables" not in self._cache:
+            self._cache["buildables"], self._cache["dependency_tree"] = self._run_boostdep()
+        buildables = self._cache["buildables"]
+        dependency_tree = self._cache["dependency_tree"]
+
+        components = self._analyze_components(buildables)
+
         filtered_dependency_tree = {k: [d for d in v if d in buildables] for k, v in dependency_tree.items() if k in buildables}
 
         configure_options = []
@@ -264,7 +354,10 @@ class BoostDependencyBuilder(object):
 
         requirements = {}
         for conf_option in configure_options:
-            reqs = self._grep_requirements(conf_option)
+            reqs = components[conf_option]["requirements"]
+            if reqs is None:
+                log.warning("Can't find Jamfile for %s. Unable to determine dependencies.", conf_option)
+                reqs = []
             conan_requirements, system_libs, unknown_libs = self._sort_requirements(reqs)
             if system_libs:
                 log.warning("Module '%s' (%s) has system libraries: %s", conf_option, self.boost_version, system_libs)
@@ -282,6 +375,7 @@ class BoostDependencyBuilder(object):
                 static_only=[],
             ),
             buildables=buildables,
+            components=components,
         )
 
         return boost_dependencies
@@ -337,17 +431,11 @@ class BoostDependencyBuilder(object):
         libraries = {}
         module_provides_extra = {}
 
-        #  Look for the names of libraries in Jam build files
         for buildable in boost_dependencies.buildables:
-            construct_jam = lambda jam_ext : self.boost_path / "libs" / buildable / "build" / f"Jamfile{jam_ext}"
-            try:
-                buildable_jam = next(construct_jam(jam_ext) for jam_ext in ("", ".v2") if construct_jam(jam_ext).is_file())
-            except StopIteration:
+            buildable_libs = boost_dependencies.components[buildable]["libraries"]
+            if buildable_libs is None:
                 raise Exception(f"Cannot find jam build file for {buildable}")
-            jam_text = buildable_jam.read_text()
-            buildable_libs = re.findall("[ \n](boost-)?lib ([a-zA-Z0-9_]+)[ \n]", jam_text)
-            buildable_libs = set(f"boost_{lib}" if lib_prefix else lib for lib_prefix, lib in buildable_libs)
-            buildable_libs = set(l[len("boost_"):] for l in buildable_libs if l.startswith("boost_"))  # list(filter(lambda l: l.startswith("boost"), buildable_libs))
+            buildable_libs = set(buildable_libs)
 
             if not buildable_libs:
                 # Some boost releases support multiple python versions
@@ -419,6 +507,8 @@ class BoostDependencyBuilder(object):
 
         data = self._sort_item(data)
 
+        self.save_cache()
+
         print(f"Creating {self.outputdir}")
         with self._outputpath.open("w") as fout:
             yaml.dump(data, fout)
@@ -433,6 +523,9 @@ def main(args=None) -> int:
     parser.add_argument("-U", dest="git_update", action="store_true", help="update the git repo")
     parser.add_argument("-o", dest="outputdir", default=None, type=Path, help="output dependency dir")
     parser.add_argument("-x", dest="unsafe", action="store_true", help="unsafe fast(er) operation")
+    parser.add_argument("-j", dest="jobs", default=os.cpu_count(), type=int, help="number of parallel jobs analyzing the components")
+    parser.add_argument("-c", dest="cachedir", default=None, type=Path, help="folder where the results are cached (default is <tmppath>/boost-dependencies-cache)")
+    parser.add_argument("--no-cache", dest="use_cache", action="store_false", help="do not use cached results")
 
     version_group = parser.add_mutually_exclusive_group(required=True)
     version_group.add_argument("-v", dest="boost_version", help="boost version")
@@ -446,6 +539,11 @@ def main(args=None) -> int:
     if not ns.tmppath:
         ns.tmppath = Path(tempfile.gettempdir())
     print(f"Temporary folder is {ns.tmppath}")
+    if not ns.use_cache:
+        ns.cachedir = None
+    elif not ns.cachedir:
+        ns.cachedir = Path(ns.tmppath) / "boost-dependencies-cache"
+    print(f"Cache folder is {ns.cachedir}")
     if not ns.outputdir:
         ns.outputdir = Path("dependencies")
     print(f"Dependencies folder is {ns.outputdir}")
@@ -469,6 +567,8 @@ def main(args=None) -> int:
             outputdir=ns.outputdir,
             tmppath=ns.tmppath,
             unsafe=ns.unsafe,
+            cachedir=ns.cachedir,
+            jobs=ns.jobs,
         )
 
         if not ns.git_update and not boost_collector.boost_path.exists():
@@ -479,9 +579,13 @@ def main(args=None) -> int:
             boost_collector.do_git_update()
             git_update_done = True
 
-        boost_collector.do_git_submodule_update()
+        if boost_collector.load_cache():
+            # The git checkout and boostdep are only needed to fill the cache
+            print(f"Using cached results for {boost_version}")
+        else:
+            boost_collector.do_git_submodule_update()
 
-        boost_collector.do_install_boostdep()
+            boost_collector.do_install_boostdep()
 
         boost_collector.do_create_dependency_file()
     return 0
@@ -0,0 +1,43 @@
+#include <boost/asio.hpp>
+
+#include <cstdio>
+#include <exception>
+#include <fstream>
+#include <iostream>
+#include <string>
+
+#if defined(BOOST_NAMESPACE)
+namespace boost = BOOST_NAMESPACE;
+#endif
+
+int main()
+{
+    const char *path = "boost_asio_io_uring_test.txt";
+    const std::string expected = "io_uring";
+    {
+        std::ofstream out(path);
+        out << expected;
+    }
+
+    std::string data(expected.size(), '\0');
+    std::size_t bytes_read = 0;
+    try {
+        boost::asio::io_context context;
+        boost::asio::stream_file file(context, path, boost::asio::stream_file::read_only);
+        boost::asio::async_read(file, boost::asio::buffer(&data[0], data.size()),
+            [&](const boost::system::error_code &ec, std::size_t n) {
+                if (!ec)
+                    bytes_read = n;
+            });
+        context.run();
+    } catch (const std::exception &e) {
+        // e.g. io_uring disabled by the kernel or a seccomp profile
+        std::cout << "io_uring not available at runtime: " << e.what() << std::endl;
+        std::remove(path);
+        return 0;
+    }
+    std::remove(path);
+
+    std::cout << "read " << bytes_read << " bytes through io_uring" << std::endl;
+    return bytes_read == expected.size() && data == expected ? 0 : 1;
+}
@@ -1,5 +1,7 @@
 import os
 import re
+import shutil
+import subprocess
 import textwrap
 
 from conan import ConanFile
@@ -39,6 +41,8 @@ class CPythonConan(ConanFile):
         "with_tkinter": [True, False],
         "with_curses": [True, False],
         "with_lzma": [True, False],
+        "freethreading": [True, False],
+        "jit": [True, False],
 
         # options that don't change package id
         "env_vars": [True, False],  # set environment variables
@@ -57,6 +61,8 @@ class CPythonConan(ConanFile):
         "with_tkinter": True,
         "with_curses": True,
         "with_lzma": True,
+        "freethreading": False,
+        "jit": False,
 
         # options that don't change package id
         "env_vars": True,
@@ -73,12 +79,40 @@ class CPythonConan(ConanFile):
         joiner = "" if is_msvc(self) else "."
         return f"{v.major}{joiner}{v.minor}"
 
+    @property
+    def _thread_suffix(self):
+        # Free-threaded (PEP 703) builds use a distinct ABI: python3.13t, libpython3.13t, include/python3.13t
+        return "t" if self.options.get_safe("freethreading") else ""
+
+    @property
+    def _with_libxcrypt(self):
+        # The crypt module was removed in 3.13 (PEP 594)
+        return self.settings.os != "Windows" and Version(self.version) < "3.13"
+
+    # The JIT stencils are generated at build time with a specific LLVM major version
+    _JIT_LLVM_VERSIONS = {
+        "3.13": "18",
+    }
+
+    @property
+    def _jit_llvm_version(self):
+        v = Version(self.version)
+        llvm_version = self._JIT_LLVM_VERSIONS.get(f"{v.major}.{v.minor}")
+        if llvm_version is None:
+            raise ConanInvalidConfiguration(f"The LLVM version required by the {self.ref} JIT is unknown to this recipe")
+        return llvm_version
+
     def export_sources(self):
         export_conandata_patches(self)
 
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        v = Version(self.version)
+        if v < "3.13" or is_msvc(self):
+            del self.options.freethreading
+        if f"{v.major}.{v.minor}" not in self._JIT_LLVM_VERSIONS or is_msvc(self):
+            del self.options.jit
         if is_msvc(self):
             del self.options.lto
             del self.options.docstrings
@@ -86,6 +120,9 @@ class CPythonConan(ConanFile):
             del self.options.with_curses
             del self.options.with_gdbm
             del self.options.with_nis
+        if Version(self.version) >= "3.13":
+            # nis was removed in 3.13 (PEP 594)
+            self.options.rm_safe("with_nis")
 
         self.settings.compiler.rm_safe("libcxx")
         self.settings.compiler.rm_safe("cppstd")
@@ -125,7 +162,8 @@ class CPythonConan(ConanFile):
             # For the sake of this recipe, we only have later patch versions, so this version check
             # may be slightly inaccurate if a lower patch version is desired.
             transitive_crypt = Version(self.version) < "3.9"
-            self.requires("libxcrypt/4.4.36", transitive_headers=transitive_crypt, transitive_libs=transitive_crypt)
+            if self._with_libxcrypt:
+                self.requires("libxcrypt/4.4.36", transitive_headers=transitive_crypt, transitive_libs=transitive_crypt)
         if self.options.get_safe("with_bz2"):
             self.requires("bzip2/1.0.8")
         if self.options.get_safe("with_gdbm", False):
@@ -183,9 +221,32 @@ class CPythonConan(ConanFile):
                 if self.dependencies["mpdecimal"].ref.version < Version("2.5.0"):
                     raise ConanInvalidConfiguration("cpython 3.9.0 (and newer) requires (at least) mpdecimal 2.5.0")
 
+        if self.options.get_safe("freethreading") and self.options.get_safe("jit"):
+            raise ConanInvalidConfiguration("The experimental JIT is not supported in free-threaded cpython builds")
+
+        if is_msvc(self) and Version(self.version) >= "3.13":
+            # FIXME: port the PCbuild patches (_ctypes with shared libffi, pcbuild.sln module dependencies) to 3.13
+            raise ConanInvalidConfiguration(f"{self.ref} recipe does not support MSVC (yet)")
+
         if self.settings.compiler == "gcc" and Version(self.settings.compiler.version).major == 9 and Version(self.version) >= "3.12":
             raise ConanInvalidConfiguration("FIXME: GCC 9 produces an internal compiler error locally, and a link error in CCI")
 
+    def validate_build(self):
+        if self.options.get_safe("jit"):
+            llvm_version = self._jit_llvm_version
+            # Tools/jit looks for clang-<version>, or clang of that version, and the llvm-* tools next to it
+            clang = shutil.which(f"clang-{llvm_version}") or shutil.which("clang")
+            clang_version = None
+            if clang:
+                output = subprocess.run([clang, "--version"], capture_output=True, text=True).stdout
+                match = re.search(r"clang version (\d+)", output)
+                clang_version = match.group(1) if match else None
+            if clang_version != llvm_version:
+                raise ConanInvalidConfiguration(
+                    f"jit=True requires LLVM {llvm_version} (clang, llvm-objdump, llvm-readobj) in the PATH at build time"
+                    + (f", found clang {clang_version} ({clang})" if clang else "")
+                )
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
 
@@ -208,6 +269,10 @@ class CPythonConan(ConanFile):
             tc.configure_args.append("--with-system-ffi")
         if Version(self.version) >= "3.10":
             tc.configure_args.append("--disable-test-modules")
+        if self.options.get_safe("freethreading"):
+            tc.configure_args.append("--disable-gil")
+        if self.options.get_safe("jit"):
+            tc.configure_args.append("--enable-experimental-jit")
         if self.options.get_safe("with_sqlite3"):
             tc.configure_args.append("--enable-loadable-sqlite-extensions={}".format(
                 yes_no(not self.dependencies["sqlite3"].options.omit_load_extension)
@@ -752,13 +817,13 @@ class CPythonConan(ConanFile):
                         while [ -L "$__file__" ]; do
                             __file__="$(dirname "$__file__")/$(readlink "$__file__")"
                         done
-                        exec "$(dirname "$__file__")/python{self._version_suffix}" "$0" "$@"
+                        exec "$(dirname "$__file__")/python{self._version_suffix}{self._thread_suffix}" "$0" "$@"
                         '''
                         """).encode())
                     fn.write(text)
 
             if not os.path.exists(self._cpython_symlink):
-                os.symlink(f"python{self._version_suffix}", self._cpython_symlink)
+                os.symlink(f"python{self._version_suffix}{self._thread_suffix}", self._cpython_symlink)
         fix_apple_shared_install_name(self)
 
         self._write_cmake_findpython_wrapper_file()
@@ -777,7 +842,7 @@ class CPythonConan(ConanFile):
             if self.settings.build_type == "Debug":
                 python += "_d"
         else:
-            python += self._version_suffix
+            python += self._version_suffix + self._thread_suffix
         if self.settings.os == "Windows":
             python += ".exe"
         return python
@@ -788,7 +853,7 @@ class CPythonConan(ConanFile):
 
     @property
     def _abi_suffix(self):
-        res = ""
+        res = self._thread_suffix
         if self.settings.build_type == "Debug":
             res += "d"
         return res
@@ -826,13 +891,13 @@ class CPythonConan(ConanFile):
                     ["pathcch", "shlwapi", "version", "ws2_32"]
                 )
         self.cpp_info.components["python"].requires = ["zlib::zlib"]
-        if self.settings.os != "Windows":
+        if self._with_libxcrypt:
             self.cpp_info.components["python"].requires.append("libxcrypt::libxcrypt")
         self.cpp_info.components["python"].set_property(
-            "pkg_config_name", f"python-{py_version.major}.{py_version.minor}"
+            "pkg_config_name", f"python-{py_version.major}.{py_version.minor}{self._thread_suffix}"
         )
         self.cpp_info.components["python"].set_property(
-            "pkg_config_aliases", [f"python{py_version.major}"]
+            "pkg_config_aliases", [f"python{py_version.major}{self._thread_suffix}"]
         )
         self.cpp_info.components["python"].libdirs = []
 
@@ -841,10 +906,10 @@ class CPythonConan(ConanFile):
         self.cpp_info.components["embed"].libdirs = [libdir]
         self.cpp_info.components["embed"].includedirs = []
         self.cpp_info.components["embed"].set_property(
-            "pkg_config_name", f"python-{py_version.major}.{py_version.minor}-embed"
+            "pkg_config_name", f"python-{py_version.major}.{py_version.minor}{self._thread_suffix}-embed"
         )
         self.cpp_info.components["embed"].set_property(
-            "pkg_config_aliases", [f"python{py_version.major}-embed"]
+            "pkg_config_aliases", [f"python{py_version.major}{self._thread_suffix}-embed"]
         )
         self.cpp_info.components["embed"].requires = ["python"]
 
@@ -867,7 +932,8 @@ class CPythonConan(ConanFile):
             if self.settings.os != "Windows":
                 if not is_apple_os(self):
                     self.cpp_info.components["_hidden"].requires.append("util-linux-libuuid::util-linux-libuuid")
-                self.cpp_info.components["_hidden"].requires.append("libxcrypt::libxcrypt")
+                if self._with_libxcrypt:
+                    self.cpp_info.components["_hidden"].requires.append("libxcrypt::libxcrypt")
             if self.options.with_bz2:
                 self.cpp_info.components["_hidden"].requires.append("bzip2::bzip2")
             if self.options.get_safe("with_gdbm", False):
@@ -156,6 +156,12 @@ class TestPackageConan(ConanFile):
                 with env.vars(self).apply():
                     self._test_module("ssl", True)
 
+            if self._py_version >= "3.13":
+                self._test_module("freethreading", self._cpython_option("freethreading"))
+                if not is_msvc(self):
+                    # sysconfig does not expose the core compiler flags of MSVC builds
+                    self._test_module("jit", self._cpython_option("jit"))
+
             if is_apple_os(self) and not self._cpython_option("shared"):
                 self.output.info(
                     "Not testing the module, because these seem not to work on apple when cpython is built as"
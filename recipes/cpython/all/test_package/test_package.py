@@ -189,6 +189,23 @@ def test_ssl():
     print("default_context.options={}".format(default_context.options))
 
 
+@add_test
+def test_freethreading():
+    import sysconfig
+
+    if not sysconfig.get_config_var("Py_GIL_DISABLED"):
+        raise Exception("cpython was not built with --disable-gil")
+    print("GIL enabled at runtime: {}".format(sys._is_gil_enabled()))
+
+
+@add_test
+def test_jit():
+    import sysconfig
+
+    if "_Py_JIT" not in (sysconfig.get_config_var("PY_CORE_CFLAGS") or ""):
+        raise Exception("cpython was not built with --enable-experimental-jit")
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("-b", dest="build_folder", help="build_folder", required=True)
@@ -39,6 +39,8 @@ class DuckdbConan(ConanFile):
         "with_shell": [True, False],
         "with_threads": [True, False],
         "with_rdtsc": [True, False],
+        "with_jemalloc": [True, False],
+        "with_parquet": [True, False],
     }
     default_options = {
         "shared": False,
@@ -59,6 +61,8 @@ class DuckdbConan(ConanFile):
         "with_shell": False,
         "with_threads": True,
         "with_rdtsc": False,
+        "with_jemalloc": True,
+        "with_parquet": True,
     }
     short_paths = True
 
@@ -66,6 +70,11 @@ class DuckdbConan(ConanFile):
     def _min_cppstd(self):
         return 11
 
+    @property
+    def _jemalloc_builtin(self):
+        # Whether upstream loads the jemalloc extension by default
+        return self.settings.os == "Linux" and (Version(self.version) < "0.10.1" or self.settings.arch == "x86_64")
+
     def export_sources(self):
         export_conandata_patches(self)
 
@@ -74,6 +83,11 @@ class DuckdbConan(ConanFile):
             del self.options.fPIC
         if Version(self.version) >= "1.1.0":
             del self.options.with_odbc
+        # The jemalloc extension is only available on Linux
+        if self.settings.os != "Linux":
+            del self.options.with_jemalloc
+        elif not self._jemalloc_builtin:
+            self.options.with_jemalloc = False
 
     def configure(self):
         if self.options.shared:
@@ -131,7 +145,16 @@ class DuckdbConan(ConanFile):
             build_extensions += ";inet"
         if self.options.with_sqlsmith:
             build_extensions += ";sqlsmith"
+        skip_extensions = ""
+        if self.options.get_safe("with_jemalloc"):
+            if not self._jemalloc_builtin:
+                build_extensions += ";jemalloc"
+        elif self._jemalloc_builtin:
+            skip_extensions += ";jemalloc"
+        if not self.options.with_parquet:
+            skip_extensions += ";parquet"
         tc.variables["BUILD_EXTENSIONS"] = build_extensions
+        tc.variables["SKIP_EXTENSIONS"] = skip_extensions
 
         if "with_odbc" in self.options:
             tc.variables["BUILD_ODBC_DRIVER"] = self.options.with_odbc
@@ -207,7 +230,7 @@ class DuckdbConan(ConanFile):
                 self.cpp_info.libs.append("autocomplete_extension")
             if self.options.with_icu:
                 self.cpp_info.libs.append("icu_extension")
-            if self.options.get_safe("with_parquet", True):
+            if self.options.with_parquet:
                 self.cpp_info.libs.append("parquet_extension")
             if self.options.with_tpch:
                 self.cpp_info.libs.append("tpch_extension")
@@ -219,8 +242,7 @@ class DuckdbConan(ConanFile):
                 self.cpp_info.libs.append("visualizer_extension")
             if self.options.with_httpfs:
                 self.cpp_info.libs.append("httpfs_extension")
-            if (self.settings.os == "Linux" and
-                (Version(self.version) < "0.10.1" or self.settings.arch == "x86_64")):
+            if self.options.get_safe("with_jemalloc"):
                 self.cpp_info.libs.append("jemalloc_extension")
             if self.options.with_json:
                 self.cpp_info.libs.append("json_extension")
@@ -4,4 +4,10 @@
 int main() {
     duckdb::DuckDB db(nullptr);
 	duckdb::Connection con(db);
+	auto result = con.Query("SELECT extension_name FROM duckdb_extensions() WHERE loaded ORDER BY extension_name");
+	if (result->HasError()) {
+		std::cerr << result->GetError() << std::endl;
+		return 1;
+	}
+	result->Print();
 }
@@ -21,10 +21,14 @@ class FaissConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "opt_level": ["generic", "avx2", "avx512", "sve"],
+        "blas": ["openblas", "reference"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "opt_level": "generic",
+        "blas": "openblas",
     }
 
     implements = ["auto_shared_fpic"]
@@ -32,8 +36,19 @@ class FaissConan(ConanFile):
     def layout(self):
         cmake_layout(self, src_folder="src")
 
+    @property
+    def _opt_libs(self):
+        # Libraries built for each FAISS_OPT_LEVEL, in addition to the generic one
+        return {
+            "generic": [],
+            "avx2": ["faiss_avx2"],
+            "avx512": ["faiss_avx2", "faiss_avx512"],
+            "sve": ["faiss_sve"],
+        }[str(self.options.opt_level)]
+
     def requirements(self):
-        self.requires("openblas/0.3.27")
+        if self.options.blas == "openblas":
+            self.requires("openblas/0.3.27")
         self.requires("gflags/2.2.2")
 
     def build_requirements(self):
@@ -46,6 +61,11 @@ class FaissConan(ConanFile):
             raise ConanInvalidConfiguration("OpenMP support is required, which is not "
                                             "available in Apple Clang")
 
+        if self.options.opt_level in ["avx2", "avx512"] and self.settings.arch != "x86_64":
+            raise ConanInvalidConfiguration(f"opt_level={self.options.opt_level} requires x86_64")
+        if self.options.opt_level == "sve" and self.settings.arch != "armv8":
+            raise ConanInvalidConfiguration("opt_level=sve requires armv8")
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
         replace_in_file(self, os.path.join(self.source_folder, "CMakeLists.txt"),
@@ -57,6 +77,10 @@ class FaissConan(ConanFile):
         tc.cache_variables["BUILD_TESTING"] = False
         tc.cache_variables["FAISS_ENABLE_PYTHON"] = False
         tc.cache_variables["CMAKE_TRY_COMPILE_CONFIGURATION"] = str(self.settings.build_type)
+        tc.cache_variables["FAISS_OPT_LEVEL"] = str(self.options.opt_level)
+        # Don't let FindBLAS/FindLAPACK pick whatever they find first. "reference" is the
+        # Netlib BLAS/LAPACK provided by the system, there is no recipe for it yet
+        tc.cache_variables["BLA_VENDOR"] = "OpenBLAS" if self.options.blas == "openblas" else "Generic"
 
         tc.generate()
 
@@ -78,15 +102,33 @@ class FaissConan(ConanFile):
         rmdir(self, os.path.join(self.package_folder, "share"))
         rm(self, "*.pdb", self.package_folder, recursive=True)
 
-    def package_info(self):
-        self.cpp_info.libs = ["faiss"]
-
-        self.cpp_info.set_property("cmake_file_name", "faiss")
-        self.cpp_info.set_property("cmake_target_name", "faiss")
-
+    @property
+    def _system_libs(self):
+        system_libs = []
+        if self.options.blas == "reference":
+            system_libs.extend(["lapack", "blas"])
         if self.settings.os in ["Linux", "FreeBSD"]:
-            self.cpp_info.system_libs = ["m", "dl"]
+            system_libs.extend(["m", "dl"])
+        return system_libs
 
+    @property
+    def _openmp_link_flags(self):
         if not self.options.shared and self.settings.compiler in ("clang", "gcc"):
-            self.cpp_info.exelinkflags.append("-fopenmp")
-            self.cpp_info.sharedlinkflags.append("-fopenmp")
+            return ["-fopenmp"]
+        return []
+
+    def package_info(self):
+        self.cpp_info.set_property("cmake_file_name", "faiss")
+
+        # faiss_avx2, faiss_avx512 and faiss_sve are full variants of the faiss library built
+        # with other compiler flags: consumers link either the faiss target or one of them.
+        for lib in ["faiss"] + self._opt_libs:
+            component = self.cpp_info.components[lib]
+            component.set_property("cmake_target_name", lib)
+            component.libs = [lib]
+            component.requires = ["gflags::gflags"]
+            if self.options.blas == "openblas":
+                component.requires.append("openblas::openblas")
+            component.system_libs = self._system_libs
+            component.exelinkflags = self._openmp_link_flags
+            component.sharedlinkflags = self._openmp_link_flags
@@ -43,8 +43,21 @@ class GoogleCloudCppConan(ConanFile):
     url = "https://github.com/conan-io/conan-center-index"
     package_type = "library"
     settings = "os", "arch", "compiler", "build_type"
-    options = {"shared": [True, False], "fPIC": [True, False]}
-    default_options = {"shared": False, "fPIC": True}
+    options = {
+        "shared": [True, False],
+        "fPIC": [True, False],
+        "components": [None, "ANY"],
+    }
+    default_options = {
+        "shared": False,
+        "fPIC": True,
+        "components": None,
+    }
+    options_description = {
+        "components": "Comma separated list of libraries to build (e.g. 'storage,pubsub'), together with "
+                      "the libraries they depend on. `compute` selects all the `compute_*` libraries. "
+                      "All the GA libraries are built if not set",
+    }
     exports = ["components_2_15_1.py",
                "components_2_19_0.py",
                "components_2_28_0.py",
@@ -72,10 +85,35 @@ class GoogleCloudCppConan(ConanFile):
         "bigquery", "bigtable", "iam", "oauth2", "pubsub", "spanner", "storage",
     }
 
+    # Common components shared by other compute components
+    _COMPUTE_COMMON_COMPONENTS = [
+        'compute_global_operations',
+        'compute_global_organization_operations',
+        'compute_region_operations',
+        'compute_zone_operations',
+    ]
+    # These components do not depend on gRPC, nor on `grpc_utils`.
+    _REST_ONLY_COMPONENTS = {"oauth2", "storage"}
+    # A small number of gRPC-generated stubs are used directly in the common components
+    # shared by all gRPC-based libraries.  These must be defined without reference to `grpc_utils`.
+    _GRPC_UTILS_REQUIRED_PROTOS = [
+        "iam_credentials_v1_iamcredentials_protos",
+        "iam_v1_policy_protos",
+        "longrunning_operations_protos",
+        "rpc_error_details_protos",
+        "rpc_status_protos",
+    ]
+
     @property
     def _is_legacy_one_profile(self):
         return not hasattr(self, "settings_build")
 
+    @property
+    def _requested_components(self):
+        if not self.options.components:
+            return []
+        return sorted(set(c.strip() for c in str(self.options.components).split(",") if c.strip()))
+
     def export_sources(self):
         export_conandata_patches(self)
 
@@ -89,6 +127,10 @@ class GoogleCloudCppConan(ConanFile):
             self.options["protobuf"].shared = True
             self.options["grpc"].shared = True
 
+    def package_id(self):
+        if self.info.options.components:
+            self.info.options.components = ",".join(self._requested_components)
+
     def validate(self):
         # As-of 2022-03, google-cloud-cpp only supports "Visual Studio >= 2019",
         # and Visual Studio < 2019 is out of mainline support.
@@ -119,6 +161,16 @@ class GoogleCloudCppConan(ConanFile):
                 f"The inter-component components are unknown for version {self.version}. Expected one of {self._PROTO_COMPONENT_DEPENDENCIES.keys()}"
             )
 
+        if self.options.components:
+            available = self._all_components()
+            if any(c.startswith("compute_") for c in available):
+                available.append("compute")
+            unknown = [c for c in self._requested_components if c not in available]
+            if unknown:
+                raise ConanInvalidConfiguration(
+                    f"{self.ref} components not available in this configuration: {', '.join(unknown)}"
+                )
+
         if (
             self.settings.compiler == "clang"
             and Version(self.settings.compiler.version) < "6.0"
@@ -134,7 +186,7 @@ class GoogleCloudCppConan(ConanFile):
         ):
             raise ConanInvalidConfiguration("Building requires GCC >= 5.4")
 
-        if self.info.options.shared and \
+        if self.info.options.shared and self._uses_grpc(self._components()) and \
            (not self.dependencies["protobuf"].options.shared or \
             not self.dependencies["grpc"].options.shared):
             raise ConanInvalidConfiguration(
@@ -148,20 +200,24 @@ class GoogleCloudCppConan(ConanFile):
         get(self, **self.conan_data["sources"][self.version], destination=self.source_folder, strip_root=True)
 
     def requirements(self):
+        components = self._components()
         # These must remain pinned in conan index.
-        self.requires("protobuf/3.21.12", transitive_headers=True)
         self.requires("abseil/[>=20230125.3 <=20230802.1]", transitive_headers=True)
-        self.requires("grpc/1.54.3", transitive_headers=True)
-        self.requires("nlohmann_json/3.11.3")
-        self.requires("crc32c/1.1.2")
-        # The rest require less pinning.
-        self.requires("libcurl/[>=7.78 <9]")
-        self.requires("openssl/[>=1.1 <4]")
-        self.requires("zlib/[>=1.2.11 <2]")
+        if self._uses_grpc(components):
+            self.requires("protobuf/3.21.12", transitive_headers=True)
+            self.requires("grpc/1.54.3", transitive_headers=True)
+        if self._uses_rest(components):
+            self.requires("nlohmann_json/3.11.3")
+            # The rest require less pinning.
+            self.requires("libcurl/[>=7.78 <9]")
+            self.requires("openssl/[>=1.1 <4]")
+            self.requires("zlib/[>=1.2.11 <2]")
+        if "storage" in components:
+            self.requires("crc32c/1.1.2")
 
     def build_requirements(self):
         # For the `grpc-cpp-plugin` executable, and indirectly `protoc`
-        if not self._is_legacy_one_profile:
+        if not self._is_legacy_one_profile and self._uses_grpc(self._components()):
             self.tool_requires("grpc/<host_version>")
 
     def generate(self):
@@ -201,6 +257,18 @@ class GoogleCloudCppConan(ConanFile):
         deps = self._PROTO_COMPONENT_DEPENDENCIES.get(self.version, dict())
         return deps.get(component, [])
 
+    def _proto_closure(self, protos):
+        # The transitive `*_protos` dependencies of `protos`, including themselves.
+        result = set()
+        pending = list(protos)
+        while pending:
+            proto = pending.pop()
+            if proto in result:
+                continue
+            result.add(proto)
+            pending.extend(d for d in self._generate_proto_requires(proto) if "::" not in d)
+        return result
+
     _SKIPPED_COMPONENTS = {
         # Some protos do not compile due to inconvenient system macros clashing
         # with proto enum values. Protobuf can workaround these problems, but
@@ -212,7 +280,7 @@ class GoogleCloudCppConan(ConanFile):
         'storagetransfer',
     }
 
-    def _components(self):
+    def _all_components(self):
         result = self._GA_COMPONENTS.get(str(self.version), []).copy()
         for c in self._SKIPPED_COMPONENTS:
             result.remove(c)
@@ -225,7 +293,53 @@ class GoogleCloudCppConan(ConanFile):
             result.remove('securitycenter')
         return result
 
+    def _components(self):
+        available = self._all_components()
+        if not self.options.components:
+            return available
+        enabled = set()
+        for c in self._requested_components:
+            if c == "compute":
+                enabled.update(a for a in available if a.startswith("compute_"))
+            else:
+                enabled.add(c)
+        # Some libraries use the protos (and thus need the generated code) of
+        # other libraries, e.g. `contentwarehouse` needs `documentai`. Compute
+        # the fixed point using the generated dependency tables.
+        while True:
+            needed = set(enabled)
+            if any(c.startswith("compute_") for c in enabled):
+                needed.update(self._COMPUTE_COMMON_COMPONENTS)
+            protos = self._proto_closure(f"{c}_protos" for c in enabled)
+            needed.update(c for c in available if f"{c}_protos" in protos)
+            if needed == enabled:
+                break
+            enabled = needed
+        return [c for c in available if c in enabled]
+
+    def _uses_grpc(self, components):
+        return any(c not in self._REST_ONLY_COMPONENTS for c in components)
+
+    def _uses_rest(self, components):
+        return any(c in self._REST_ONLY_COMPONENTS or c.startswith("compute_") for c in components)
+
     def _proto_components(self):
+        result = self._all_proto_components()
+        if not self.options.components:
+            return result
+        components = self._components()
+        roots = []
+        if self._uses_grpc(components):
+            roots = [f"{c}_protos" for c in components if c not in self._REST_ONLY_COMPONENTS]
+            roots.extend(self._GRPC_UTILS_REQUIRED_PROTOS)
+        if any(c.startswith("compute_") for c in components) and "compute_protos" in result:
+            # Individual compute proto libraries were replaced with a single
+            # `compute_protos` library.
+            roots.append("compute_protos")
+        closure = self._proto_closure(roots)
+        return [c for c in result if c in closure]
+
+    def _all_proto_components(self):
         result = self._PROTO_COMPONENTS.get(self.version, []).copy()
         for c in self._SKIPPED_COMPONENTS:
             result.remove(c + '_protos')
@@ -266,64 +380,60 @@ class GoogleCloudCppConan(ConanFile):
     # with dependencies between them
     def _add_compute_component(self, component, protos):
         SHARED_REQUIRES=["rest_protobuf_internal", "rest_internal", "common"]
-        # Common components shared by other compute components
-        COMPUTE_COMMON_COMPONENTS = [
-            'compute_global_operations',
-            'compute_global_organization_operations',
-            'compute_region_operations',
-            'compute_zone_operations',
-        ]
         requires = [protos]
-        if component not in COMPUTE_COMMON_COMPONENTS:
-            requires = requires + COMPUTE_COMMON_COMPONENTS
+        if component not in self._COMPUTE_COMMON_COMPONENTS:
+            requires = requires + self._COMPUTE_COMMON_COMPONENTS
         self.cpp_info.components[component].requires = requires + SHARED_REQUIRES
         self.cpp_info.components[component].libs = [f"google_cloud_cpp_{component}"]
         self.cpp_info.components[component].names["pkg_config"] = f"google_cloud_cpp_{component}"
 
     def package_info(self):
+        components = self._components()
+        proto_components = self._proto_components()
+        with_grpc = self._uses_grpc(components)
+        with_rest = self._uses_rest(components)
+
         self.cpp_info.components["common"].requires = ["abseil::absl_any", "abseil::absl_flat_hash_map", "abseil::absl_memory", "abseil::absl_optional", "abseil::absl_time"]
         self.cpp_info.components["common"].libs = ["google_cloud_cpp_common"]
         self.cpp_info.components["common"].names["pkg_config"] = "google_cloud_cpp_common"
 
-        self.cpp_info.components["rest_internal"].requires = ["common", "libcurl::libcurl", "openssl::ssl", "openssl::crypto", "zlib::zlib"]
-        self.cpp_info.components["rest_internal"].libs = ["google_cloud_cpp_rest_internal"]
-        self.cpp_info.components["rest_internal"].names["pkg_config"] = "google_cloud_cpp_rest_internal"
-
-        # A small number of gRPC-generated stubs are used directly in the common components
-        # shared by all gRPC-based libraries.  These must be defined without reference to `grpc_utils`.
-        GRPC_UTILS_REQUIRED_PROTOS = {
-            "iam_credentials_v1_iamcredentials_protos",
-            "iam_v1_policy_protos",
-            "longrunning_operations_protos",
-            "rpc_error_details_protos",
-            "rpc_status_protos",
-        }
-        for component in GRPC_UTILS_REQUIRED_PROTOS:
-            self._add_proto_component(component)
+        if with_rest:
+            self.cpp_info.components["rest_internal"].requires = ["common", "nlohmann_json::nlohmann_json", "libcurl::libcurl", "openssl::ssl", "openssl::crypto", "zlib::zlib"]
+            self.cpp_info.components["rest_internal"].libs = ["google_cloud_cpp_rest_internal"]
+            self.cpp_info.components["rest_internal"].names["pkg_config"] = "google_cloud_cpp_rest_internal"
 
-        self.cpp_info.components["grpc_utils"].requires = list(GRPC_UTILS_REQUIRED_PROTOS) + ["common", "abseil::absl_function_ref", "abseil::absl_memory", "abseil::absl_time", "grpc::grpc++", "grpc::_grpc"]
-        self.cpp_info.components["grpc_utils"].libs = ["google_cloud_cpp_grpc_utils"]
-        self.cpp_info.components["grpc_utils"].names["pkg_config"] = "google_cloud_cpp_grpc_utils"
+        if with_grpc:
+            for component in self._GRPC_UTILS_REQUIRED_PROTOS:
+                self._add_proto_component(component)
+
+            self.cpp_info.components["grpc_utils"].requires = self._GRPC_UTILS_REQUIRED_PROTOS + ["common", "abseil::absl_function_ref", "abseil::absl_memory", "abseil::absl_time", "grpc::grpc++", "grpc::_grpc"]
+            self.cpp_info.components["grpc_utils"].libs = ["google_cloud_cpp_grpc_utils"]
+            self.cpp_info.components["grpc_utils"].names["pkg_config"] = "google_cloud_cpp_grpc_utils"
 
-        for component in self._proto_components():
+        for component in proto_components:
             if component == 'storage_protos':
                 # The `storage_protos` are compiled only when needed. They are
                 # not used in Conan because they are only needed for an
                 # experimental library, supporting an allow-listed service.
                 continue
-            if component not in GRPC_UTILS_REQUIRED_PROTOS:
+            if component not in self._GRPC_UTILS_REQUIRED_PROTOS:
                 self._add_proto_component(component)
 
         # Interface libraries for backwards compatibility
-        self.cpp_info.components["cloud_bigquery_protos"].requires = ["bigquery_protos"]
-        self.cpp_info.components["cloud_dialogflow_v2_protos"].requires = ["dialogflow_es_protos"]
-        self.cpp_info.components["cloud_speech_protos"].requires = ["speech_protos"]
-        self.cpp_info.components["cloud_texttospeech_protos"].requires = ["texttospeech_protos"]
-        self.cpp_info.components["devtools_cloudtrace_v2_trace_protos"].requires = ["trace_protos"]
-        self.cpp_info.components["devtools_cloudtrace_v2_tracing_protos"].requires = ["trace_protos"]
-        self.cpp_info.components["logging_type_type_protos"].requires = ["logging_type_protos"]
-
-        for component in self._components():
+        COMPATIBILITY_PROTOS = {
+            "cloud_bigquery_protos": "bigquery_protos",
+            "cloud_dialogflow_v2_protos": "dialogflow_es_protos",
+            "cloud_speech_protos": "speech_protos",
+            "cloud_texttospeech_protos": "texttospeech_protos",
+            "devtools_cloudtrace_v2_trace_protos": "trace_protos",
+            "devtools_cloudtrace_v2_tracing_protos": "trace_protos",
+            "logging_type_type_protos": "logging_type_protos",
+        }
+        for component, protos in COMPATIBILITY_PROTOS.items():
+            if protos in proto_components:
+                self.cpp_info.components[component].requires = [protos]
+
+        for component in components:
             protos=f"{component}_protos"
             # `compute` components do not depend on gRPC
             if component.startswith("compute_"):
@@ -338,23 +448,30 @@ class GoogleCloudCppConan(ConanFile):
                 continue
             self._add_grpc_component(component, protos)
 
-        self._add_grpc_component("bigtable", "bigtable_protos")
-        self._add_grpc_component("iam", "iam_protos")
-        self._add_grpc_component("pubsub", "pubsub_protos", ["abseil::absl_flat_hash_map"])
-        self._add_grpc_component("spanner", "spanner_protos",  ["abseil::absl_fixed_array", "abseil::absl_numeric", "abseil::absl_strings", "abseil::absl_time"])
-
-        if Version(self.version) >= '2.19.0':
+        if "bigtable" in components:
+            self._add_grpc_component("bigtable", "bigtable_protos")
+        if "iam" in components:
+            self._add_grpc_component("iam", "iam_protos")
+        if "pubsub" in components:
+            self._add_grpc_component("pubsub", "pubsub_protos", ["abseil::absl_flat_hash_map"])
+        if "spanner" in components:
+            self._add_grpc_component("spanner", "spanner_protos",  ["abseil::absl_fixed_array", "abseil::absl_numeric", "abseil::absl_strings", "abseil::absl_time"])
+
+        compute_components = [c for c in components if c.startswith("compute_")]
+        if Version(self.version) >= '2.19.0' and compute_components:
             self.cpp_info.components["rest_protobuf_internal"].requires = ["rest_internal", "grpc_utils", "common"]
             self.cpp_info.components["rest_protobuf_internal"].libs = ["google_cloud_cpp_rest_protobuf_internal"]
             self.cpp_info.components["rest_protobuf_internal"].names["pkg_config"] = "google_cloud_cpp_rest_protobuf_internal"
             # The `google-cloud-cpp::compute` interface library groups all the compute
             # libraries in a single target.
-            self.cpp_info.components["compute"].requires = [c for c in self._components() if c.startswith("compute_")]
+            self.cpp_info.components["compute"].requires = compute_components
+        if Version(self.version) >= '2.19.0' and "oauth2" in components:
             # The `google-cloud-cpp::oauth2` library does not depend on gRPC or any protos.
             self.cpp_info.components["oauth2"].requires = ["rest_internal", "common", "nlohmann_json::nlohmann_json", "libcurl::libcurl", "openssl::ssl", "openssl::crypto", "zlib::zlib"]
             self.cpp_info.components["oauth2"].libs = ["google_cloud_cpp_oauth2"]
             self.cpp_info.components["oauth2"].names["pkg_config"] = "google_cloud_cpp_oauth2"
 
-        self.cpp_info.components["storage"].requires = ["rest_internal", "common", "nlohmann_json::nlohmann_json", "abseil::absl_memory", "abseil::absl_strings", "abseil::absl_str_format", "abseil::absl_time", "abseil::absl_variant", "crc32c::crc32c", "libcurl::libcurl", "openssl::ssl", "openssl::crypto", "zlib::zlib"]
-        self.cpp_info.components["storage"].libs = ["google_cloud_cpp_storage"]
-        self.cpp_info.components["storage"].names["pkg_config"] = "google_cloud_cpp_storage"
+        if "storage" in components:
+            self.cpp_info.components["storage"].requires = ["rest_internal", "common", "nlohmann_json::nlohmann_json", "abseil::absl_memory", "abseil::absl_strings", "abseil::absl_str_format", "abseil::absl_time", "abseil::absl_variant", "crc32c::crc32c", "libcurl::libcurl", "openssl::ssl", "openssl::crypto", "zlib::zlib"]
+            self.cpp_info.components["storage"].libs = ["google_cloud_cpp_storage"]
+            self.cpp_info.components["storage"].names["pkg_config"] = "google_cloud_cpp_storage"
@@ -1,6 +1,7 @@
 import os
 
 from conan import ConanFile
+from conan.errors import ConanException
 from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
 from conan.tools.build import can_run
 from conan.tools.env import VirtualBuildEnv, VirtualRunEnv
@@ -30,9 +31,44 @@ class TestPackageConan(ConanFile):
             return False
         return Version(self.dependencies["google-cloud-cpp"].ref.version) >= "2.19.0"
 
+    def _requested_components(self):
+        if not hasattr(self, "dependencies"):
+            return []
+        components = self.dependencies["google-cloud-cpp"].options.get_safe("components")
+        if not components:
+            return []
+        return [c.strip() for c in str(components).split(",")]
+
+    def _tests(self):
+        tests = ["bigtable", "pubsub", "spanner", "speech", "storage"]
+        if self._supports_compute():
+            tests.append("compute")
+        requested = self._requested_components()
+        if requested:
+            # Only test the libraries that were requested
+            tests = [t for t in tests if t in requested]
+        return tests
+
+    def _check_subset_dependencies(self):
+        # A subset build must not drag in the dependencies of the libraries
+        # that were left out. The two interesting cases are:
+        #   conan create . --version=<v> -o "google-cloud-cpp/*:components=storage"
+        #   conan create . --version=<v> -o "google-cloud-cpp/*:components=pubsub"
+        requested = self._requested_components()
+        if requested == ["storage"]:
+            unexpected = ["grpc", "protobuf"]
+        elif requested == ["pubsub"]:
+            unexpected = ["crc32c", "libcurl", "nlohmann_json"]
+        else:
+            return
+        found = [d for d in unexpected if d in self.dependencies]
+        if found:
+            raise ConanException(f"google-cloud-cpp built with components={requested[0]} should not require {', '.join(found)}")
+
     def generate(self):
+        self._check_subset_dependencies()
         tc = CMakeToolchain(self)
-        tc.variables["WITH_COMPUTE"] = self._supports_compute()
+        tc.variables["GOOGLE_CLOUD_CPP_TESTS"] = ";".join(self._tests())
         tc.generate()
         if self._is_legacy_one_profile:
             VirtualRunEnv(self).generate(scope="build")
@@ -51,9 +87,6 @@ class TestPackageConan(ConanFile):
     def test(self):
         if not can_run(self):
             return
-        for test in ["bigtable", "pubsub", "spanner", "speech", "storage"]:
+        for test in self._tests():
             cmd = os.path.join(self.cpp.build.bindir, test)
             self.run(cmd, env="conanrun")
-        if self._supports_compute():
-            cmd = os.path.join(self.cpp.build.bindir, "compute")
-            self.run(cmd, env="conanrun")
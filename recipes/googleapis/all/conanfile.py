@@ -3,7 +3,7 @@ import glob
 import os
 
 from conan import ConanFile
-from conan.errors import ConanInvalidConfiguration
+from conan.errors import ConanException, ConanInvalidConfiguration
 from conan.tools.build import check_min_cppstd
 from conan.tools.cmake import CMake, CMakeDeps, CMakeToolchain, cmake_layout
 from conan.tools.env import VirtualBuildEnv, VirtualRunEnv
@@ -11,7 +11,7 @@ from conan.tools.files import apply_conandata_patches, copy, export_conandata_pa
 from conan.tools.microsoft import is_msvc
 from conan.tools.scm import Version
 
-from helpers import parse_proto_libraries
+from helpers import dump_proto_libraries, load_proto_libraries, parse_proto_libraries
 
 required_conan_version = ">=1.60.0 <2 || >=2.0.5"
 
@@ -28,10 +28,16 @@ class GoogleAPIS(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "components": [None, "ANY"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "components": None,
+    }
+    options_description = {
+        "components": "Comma separated list of Bazel targets to build (e.g. '//google/rpc:status_proto'), "
+                      "together with their dependencies. All the libraries are built if not set",
     }
     exports = "helpers.py"
     short_paths = True
@@ -40,6 +46,12 @@ class GoogleAPIS(ConanFile):
     def _is_legacy_one_profile(self):
         return not hasattr(self, "settings_build")
 
+    @property
+    def _requested_components(self):
+        if not self.options.components:
+            return []
+        return sorted(set(it.strip() for it in str(self.options.components).split(",") if it.strip()))
+
     def export_sources(self):
         copy(self, "CMakeLists.txt", src=self.recipe_folder, dst=os.path.join(self.export_sources_folder, "src"))
         export_conandata_patches(self)
@@ -60,7 +72,16 @@ class GoogleAPIS(ConanFile):
         # https://github.com/conan-io/conan-center-index/pull/15601#issuecomment-1493086506
         self.requires("protobuf/3.21.12", transitive_headers=True, transitive_libs=True)
 
+    def package_id(self):
+        # Order and duplicates don't change the resulting package
+        if self.info.options.components:
+            self.info.options.components = ",".join(self._requested_components)
+
     def validate(self):
+        if self.options.components:
+            for it in self._requested_components:
+                if not it.startswith("//") or ":" not in it:
+                    raise ConanInvalidConfiguration(f"'{it}' is not a Bazel target like '//google/rpc:status_proto'")
         if self.settings.compiler.get_safe("cppstd"):
             check_min_cppstd(self, 11)
         if self.settings.compiler == "gcc" and Version(self.settings.compiler.version) <= "5":
@@ -116,8 +137,23 @@ class GoogleAPIS(ConanFile):
                     continue
                 activate_library(all_dict[it_dep])
 
-        for it in filter(lambda u: u.is_used, proto_libraries):
-            activate_library(it)
+        if self.options.components:
+            # Only the requested libraries and their dependencies
+            unknown = [it for it in self._requested_components if it not in all_dict]
+            if unknown:
+                raise ConanException(f"Unknown googleapis components: {', '.join(unknown)}")
+            for it in proto_libraries:
+                it.is_used = False
+            for it in self._requested_components:
+                activate_library(all_dict[it])
+            # Also provide the C++ wrappers (*_cc_proto) of the libraries that are built
+            for it in filter(lambda u: u.is_cc and not u.is_used, proto_libraries):
+                proto_deps = [dep for dep in it.deps if dep != "protobuf::libprotobuf"]
+                if proto_deps and all(all_dict[dep].is_used for dep in proto_deps):
+                    it.is_used = True
+        else:
+            for it in filter(lambda u: u.is_used, proto_libraries):
+                activate_library(it)
 
         # Tweaks
         def deactivate_library(key):
@@ -174,11 +210,13 @@ class GoogleAPIS(ConanFile):
             f.write("# DO NOT EDIT - change the generation code in conanfile.py instead\n")
             for it in filter(lambda u: u.is_used, proto_libraries):
                 f.write(it.cmake_content)
+        dump_proto_libraries(proto_libraries, os.path.join(self.build_folder, self._INDEX_FILENAME))
         cmake = CMake(self)
         cmake.configure()
         cmake.build()
 
-    _DEPS_FILE = "res/generated_targets.deps"
+    # Resolved proto_library graph, written in build() and loaded by package_info() and consumers
+    _INDEX_FILENAME = "proto_libraries.json"
 
     def package(self):
         copy(self, pattern="LICENSE", src=self.source_folder, dst=os.path.join(self.package_folder, "licenses"))
@@ -190,20 +228,16 @@ class GoogleAPIS(ConanFile):
         copy(self, pattern="*.so*", src=self.build_folder, dst=os.path.join(self.package_folder, "lib"), keep_path=False)
         copy(self, pattern="*.dylib", src=self.build_folder, dst=os.path.join(self.package_folder, "lib"), keep_path=False)
         copy(self, pattern="*.a", src=self.build_folder, dst=os.path.join(self.package_folder, "lib"), keep_path=False)
-
-        with open(os.path.join(self.package_folder, self._DEPS_FILE), "w", encoding="utf-8") as f:
-            for lib in filter(lambda u: u.is_used, self._parse_proto_libraries()):
-                interface = 'LIB' if lib.srcs else 'INTERFACE'
-                f.write(f"{lib.cmake_target} {interface} {','.join(lib.cmake_deps)}\n")
+        copy(self, pattern=self._INDEX_FILENAME, src=self.build_folder, dst=os.path.join(self.package_folder, "res"))
 
     def package_info(self):
-        with open(os.path.join(self.package_folder, self._DEPS_FILE), "r", encoding="utf-8") as f:
-            for line in f.read().splitlines():
-                (name, libtype, deps) = line.rstrip('\n').split(' ')
-                self.cpp_info.components[name].requires = deps.split(',')
-                self.cpp_info.components[name].resdirs = ["res"]
-                if libtype == 'LIB':
-                    self.cpp_info.components[name].libs = [name]
-                self.cpp_info.components[name].set_property("pkg_config_name", name)
-                if self.settings.os in ["Linux", "FreeBSD"]:
-                    self.cpp_info.components[name].system_libs.extend(["m"])
+        proto_libraries = load_proto_libraries(os.path.join(self.package_folder, "res", self._INDEX_FILENAME))
+        for lib in filter(lambda u: u.is_used, proto_libraries):
+            name = lib.cmake_target
+            self.cpp_info.components[name].requires = lib.cmake_deps
+            self.cpp_info.components[name].resdirs = ["res"]
+            if lib.srcs:
+                self.cpp_info.components[name].libs = [name]
+            self.cpp_info.components[name].set_property("pkg_config_name", name)
+            if self.settings.os in ["Linux", "FreeBSD"]:
+                self.cpp_info.components[name].system_libs.extend(["m"])
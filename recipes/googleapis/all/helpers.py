@@ -1,3 +1,4 @@
+import json
 import os
 import re
 import textwrap
@@ -25,7 +26,6 @@ class _ProtoLibrary:
             assert it in all_deps, f"{self.qname}:{self.name} - dep '{it}' not found"
 
     def dumps(self):
-        import json
         return json.dumps({
             "name": self.name,
             "qname": self.qname,
@@ -34,6 +34,26 @@ class _ProtoLibrary:
             "is_cc": self.is_cc,
         }, indent=4)
 
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "qname": self.qname,
+            "srcs": self.srcs,
+            "deps": sorted(self.deps),
+            "is_cc": self.is_cc,
+            "is_used": self.is_used,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        proto_library = cls(is_cc=data["is_cc"])
+        proto_library.name = data["name"]
+        proto_library.qname = data["qname"]
+        proto_library.srcs = data["srcs"]
+        proto_library.deps = set(data["deps"])
+        proto_library.is_used = data["is_used"]
+        return proto_library
+
     @property
     def cmake_target(self):
         qname = self.qname
@@ -188,3 +208,14 @@ def parse_proto_libraries(filename, source_folder, error):
                     action(line)
 
     return proto_libraries
+
+
+def dump_proto_libraries(proto_libraries, filename):
+    # Index of the resolved graph, so it is parsed only once
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump([it.to_dict() for it in proto_libraries], f, indent=2)
+
+
+def load_proto_libraries(filename):
+    with open(filename, 'r', encoding='utf-8') as f:
+        return [_ProtoLibrary.from_dict(it) for it in json.load(f)]
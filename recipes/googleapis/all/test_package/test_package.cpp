@@ -1,13 +1,17 @@
 #include <iostream>
+#ifdef GOOGLEAPIS_WITH_BIGTABLE
 #include <google/bigtable/v2/bigtable.pb.h>
+#endif
 
 int main() {
     std::cout << "Conan - test package for googleapis\n";
 
+#ifdef GOOGLEAPIS_WITH_BIGTABLE
     google::bigtable::v2::CheckAndMutateRowRequest request;
     request.set_table_name("projects/my-project/instances/my-instance/tables/my-table");
 
     std::cout << request.DebugString();
+#endif
 
     return 0;
 }
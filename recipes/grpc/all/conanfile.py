@@ -38,7 +38,8 @@ class GrpcConan(ConanFile):
         "ruby_plugin": [True, False],
         "otel_plugin": [True, False],
         "secure": [True, False],
-        "with_libsystemd": [True, False]
+        "with_libsystemd": [True, False],
+        "build_benchmarks": [True, False],
     }
     default_options = {
         "shared": False,
@@ -54,7 +55,8 @@ class GrpcConan(ConanFile):
         "ruby_plugin": True,
         "otel_plugin": False,
         "secure": False,
-        "with_libsystemd": True
+        "with_libsystemd": True,
+        "build_benchmarks": False,
     }
 
     _target_info = None
@@ -122,6 +124,9 @@ class GrpcConan(ConanFile):
                 self.requires("libsystemd/255")
         if self.options.get_safe("otel_plugin"):
             self.requires("opentelemetry-cpp/1.14.2")
+        if self.options.build_benchmarks:
+            # Only linked into the packaged benchmark executables
+            self.requires("benchmark/1.9.4", visible=False)
 
     def package_id(self):
         del self.info.options.secure
@@ -144,6 +149,12 @@ class GrpcConan(ConanFile):
                 "Please, use `protobuf:shared=True`.",
             )
 
+        if self.options.build_benchmarks:
+            if not (self.options.codegen and self.options.cpp_plugin):
+                raise ConanInvalidConfiguration("build_benchmarks requires codegen=True and cpp_plugin=True")
+            if self.version not in self.conan_data.get("googletest_sources", {}):
+                raise ConanInvalidConfiguration(f"{self.ref} build_benchmarks is not supported yet: no googletest sources matching its third_party/googletest pin")
+
         abseil_cppstd = self.dependencies.host['abseil'].info.settings.compiler.cppstd
         if abseil_cppstd != self.settings.compiler.cppstd:
             raise ConanInvalidConfiguration(f"grpc and abseil must be built with the same compiler.cppstd setting")
@@ -177,7 +188,13 @@ class GrpcConan(ConanFile):
 
         tc.cache_variables["gRPC_BUILD_CODEGEN"] = self.options.codegen
         tc.cache_variables["gRPC_BUILD_CSHARP_EXT"] = self.options.csharp_ext
-        tc.cache_variables["gRPC_BUILD_TESTS"] = "OFF"
+        # Tests are needed for the QPS benchmark executables, which depend on the test utilities
+        tc.cache_variables["gRPC_BUILD_TESTS"] = self.options.build_benchmarks
+        if self.options.build_benchmarks:
+            tc.cache_variables["gRPC_BENCHMARK_PROVIDER"] = "package"
+            # Only the libraries and the QPS executables are built (see build()), not the whole
+            # test suite that the install target would otherwise depend on
+            tc.cache_variables["CMAKE_SKIP_INSTALL_ALL_DEPENDENCY"] = True
 
         # We need the generated cmake/ files (bc they depend on the list of targets, which is dynamic)
         tc.cache_variables["gRPC_INSTALL"] = True
@@ -258,11 +275,39 @@ class GrpcConan(ConanFile):
             target_link_options(upb_json_lib PRIVATE -Wl,-undefined,dynamic_lookup)
             """)
 
+    def _patch_googletest_dir(self, googletest_dir):
+        # third_party/googletest is a git submodule, not part of the source archive. The sources
+        # are fetched into the build folder, point the gRPC test utilities to them
+        cmakelists = os.path.join(self.source_folder, "CMakeLists.txt")
+        googletest_dir = googletest_dir.replace("\\", "/") + "/"
+        replace_in_file(self, cmakelists, "${CMAKE_CURRENT_SOURCE_DIR}/third_party/googletest/", googletest_dir, strict=False)
+        replace_in_file(self, cmakelists, "third_party/googletest/", googletest_dir)
+
+    @property
+    def _benchmark_build_targets(self):
+        # Everything that is installed, plus the QPS benchmark executables
+        targets = [target["lib"] for target in self.target_info["grpc_targets"]]
+        if self.options.csharp_ext:
+            targets.append("grpc_csharp_ext")
+        for plugin_info in self.target_info["grpc_plugins"]:
+            executable = plugin_info["executable"]
+            if self.options.get_safe(executable.replace("grpc_", "")):
+                targets.append(executable)
+        return targets + ["qps_worker", "qps_json_driver"]
+
     def build(self):
         self._patch_sources()
+        if self.options.build_benchmarks:
+            googletest_dir = os.path.join(self.build_folder, "googletest")
+            get(self, **self.conan_data["googletest_sources"][self.version], destination=googletest_dir, strip_root=True)
+            self._patch_googletest_dir(googletest_dir)
         cmake = CMake(self)
         cmake.configure()
-        cmake.build()
+        if self.options.build_benchmarks:
+            for target in self._benchmark_build_targets:
+                cmake.build(target=target)
+        else:
+            cmake.build()
 
     @property
     def target_info(self):
@@ -281,6 +326,14 @@ class GrpcConan(ConanFile):
         rmdir(self, os.path.join(self.package_folder, "lib", "cmake"))
         rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
 
+        if self.options.build_benchmarks:
+            # Not installed by upstream
+            # Multi-config generators put them in a <build_type> subfolder
+            exe_ext = ".exe" if self.settings.os == "Windows" else ""
+            for executable in ["qps_worker", "qps_json_driver"]:
+                for pattern in [f"{executable}{exe_ext}", f"*/{executable}{exe_ext}"]:
+                    copy(self, pattern, src=self.build_folder, dst=os.path.join(self.package_folder, "bin"), keep_path=False)
+
         # Create one custom module file per executable in order to emulate
         # CMake executables imported targets of grpc plugins.
         for plugin_info in self.target_info["grpc_plugins"]:
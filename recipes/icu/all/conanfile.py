@@ -1,5 +1,6 @@
 import glob
 import hashlib
+import json
 import os
 import shutil
 
@@ -8,7 +9,7 @@ from conan.errors import ConanInvalidConfiguration
 from conan.tools.apple import is_apple_os
 from conan.tools.build import cross_building, stdcpp_library, check_min_cppstd
 from conan.tools.env import Environment, VirtualBuildEnv
-from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, mkdir, rename, replace_in_file, rm, rmdir, save
+from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, mkdir, rename, replace_in_file, rm, rmdir, save, unzip
 from conan.tools.gnu import Autotools, AutotoolsToolchain
 from conan.tools.layout import basic_layout
 from conan.tools.microsoft import check_min_vs, is_msvc, unix_path
@@ -33,6 +34,7 @@ class ICUConan(ConanFile):
         "data_packaging": ["files", "archive", "library", "static"],
         "with_dyload": [True, False],
         "dat_package_file": [None, "ANY"],
+        "data_filter": [None, "ANY"],
         "with_icuio": [True, False],
         "with_extras": [True, False],
     }
@@ -42,9 +44,15 @@ class ICUConan(ConanFile):
         "data_packaging": "archive",
         "with_dyload": True,
         "dat_package_file": None,
+        "data_filter": None,
         "with_icuio": True,
         "with_extras": False,
     }
+    options_description = {
+        "data_filter": "ICU data filter (https://unicode-org.github.io/icu/userguide/icu_data/buildtool.html), "
+                       "either the path to a JSON file or the JSON itself. The data is built from its sources "
+                       "with only the selected locales and categories, which requires Python 3",
+    }
 
     @property
     def _min_cppstd(self):
@@ -72,6 +80,10 @@ class ICUConan(ConanFile):
     def _with_unit_tests(self):
         return not self.conf.get("tools.build:skip_test", default=True, check_type=bool)
 
+    @property
+    def _inline_data_filter(self):
+        return str(self.options.data_filter).strip().startswith("{")
+
     def export_sources(self):
         export_conandata_patches(self)
 
@@ -90,6 +102,24 @@ class ICUConan(ConanFile):
         if self.options.dat_package_file:
             if not os.path.exists(str(self.options.dat_package_file)):
                 raise ConanInvalidConfiguration("Non-existent dat_package_file specified")
+        if self.options.data_filter:
+            if self.options.dat_package_file:
+                raise ConanInvalidConfiguration("data_filter and dat_package_file cannot be used together")
+            if self.version not in self.conan_data.get("data_sources", {}):
+                data_archive = self.conf.get("user.icu:data_archive", check_type=str)
+                if not data_archive:
+                    raise ConanInvalidConfiguration(
+                        f"data_filter for {self.ref} requires the icu4c-{str(self.version).replace('.', '_')}-data.zip "
+                        "archive of the release, set its path in the 'user.icu:data_archive' conf")
+                if not os.path.isfile(data_archive):
+                    raise ConanInvalidConfiguration(f"Non-existent user.icu:data_archive file specified: {data_archive}")
+            if self._inline_data_filter:
+                try:
+                    json.loads(str(self.options.data_filter))
+                except ValueError as e:
+                    raise ConanInvalidConfiguration(f"data_filter is not valid JSON: {e}")
+            elif not os.path.exists(str(self.options.data_filter)):
+                raise ConanInvalidConfiguration("Non-existent data_filter file specified")
         if Version(self.version) >= "75.1":
             if self.settings.compiler.cppstd:
                 check_min_cppstd(self, self._min_cppstd)
@@ -113,6 +143,12 @@ class ICUConan(ConanFile):
     def package_id(self):
         if self.info.options.dat_package_file:
             self.info.options.dat_package_file = self._sha256sum(str(self.info.options.dat_package_file))
+        if self.info.options.data_filter:
+            if self._inline_data_filter:
+                data_filter = json.dumps(json.loads(str(self.info.options.data_filter)), sort_keys=True)
+                self.info.options.data_filter = hashlib.sha256(data_filter.encode()).hexdigest()
+            else:
+                self.info.options.data_filter = self._sha256sum(str(self.info.options.data_filter))
 
     def build_requirements(self):
         if self._settings_build.os == "Windows":
@@ -123,6 +159,10 @@ class ICUConan(ConanFile):
         if cross_building(self) and hasattr(self, "settings_build"):
             self.tool_requires(str(self.ref))
 
+        if self.options.data_filter:
+            # The ICU data build tool (source/python/icutools) generates the data makefiles
+            self.tool_requires("cpython/3.12.7")
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
 
@@ -184,11 +224,22 @@ class ICUConan(ConanFile):
                 env.define("icu_cv_host_frag", "mh-msys-msvc")
             env.vars(self).save_script("conanbuild_icu_msvc")
 
+        if self.options.data_filter:
+            if self._inline_data_filter:
+                data_filter_file = os.path.join(self.generators_folder, "icu_data_filter.json")
+                save(self, data_filter_file, str(self.options.data_filter))
+            else:
+                data_filter_file = os.path.abspath(str(self.options.data_filter))
+            env = Environment()
+            env.define_path("ICU_DATA_FILTER_FILE", data_filter_file.replace("\\", "/"))
+            env.vars(self).save_script("conanbuild_icu_data_filter")
+
     def _patch_sources(self):
         apply_conandata_patches(self)
 
-        if not self._with_unit_tests:
+        if not self._with_unit_tests and not self.options.data_filter:
             # Prevent any call to python during configuration, it's only needed for unit tests
+            # and to build the data from its sources
             replace_in_file(
                 self,
                 os.path.join(self.source_folder, "source", "configure"),
@@ -226,6 +277,17 @@ class ICUConan(ConanFile):
             if dat_package_file:
                 shutil.copy(str(self.options.dat_package_file), dat_package_file[0])
 
+        if self.options.data_filter:
+            # The source archive only contains the prebuilt data (source/data/in/*.dat), which would be
+            # used as is. The filter is applied when the data is built from its sources.
+            data_folder = os.path.join(self.source_folder, "source", "data")
+            rmdir(self, data_folder)
+            if self.version in self.conan_data.get("data_sources", {}):
+                get(self, **self.conan_data["data_sources"][self.version], destination=data_folder, strip_root=True)
+            else:
+                # No checksummed data sources for this version yet, use the archive provided by the user
+                unzip(self, self.conf.get("user.icu:data_archive", check_type=str), destination=data_folder, strip_root=True)
+
         autotools = Autotools(self)
         autotools.configure(build_script_folder=os.path.join(self.source_folder, "source"))
         autotools.make()
@@ -39,6 +39,7 @@ class ImageMagicConan(ConanFile):
         "with_xml2": [True, False],
         "with_freetype": [True, False],
         "with_djvu": [True, False],
+        "with_openmp": [True, False],
         "utilities": [True, False],
     }
     default_options = {
@@ -62,6 +63,7 @@ class ImageMagicConan(ConanFile):
         "with_xml2": True,
         "with_freetype": True,
         "with_djvu": False,
+        "with_openmp": False,
         "utilities": True,
     }
     exports_sources = "patches/*"
@@ -86,6 +88,11 @@ class ImageMagicConan(ConanFile):
     def _modules(self):
         return ["Magick++", "MagickWand", "MagickCore"]
 
+    @property
+    def _use_llvm_openmp(self):
+        # gcc provides libgomp, clang does not always ship its OpenMP runtime
+        return self.options.with_openmp and self.settings.compiler in ("clang", "apple-clang")
+
     def validate(self):
         if self.settings.os == "Windows":
             raise ConanInvalidConfiguration(
@@ -138,6 +145,8 @@ class ImageMagicConan(ConanFile):
             self.output.warn(
                 "There is no djvu package available on Conan (yet). This recipe will use the one present on the system (if available)."
             )
+        if self._use_llvm_openmp:
+            self.requires("llvm-openmp/17.0.6")
 
     def source(self):
         tools.get(
@@ -336,7 +345,7 @@ class ImageMagicConan(ConanFile):
             return "yes" if o else "no"
 
         args = [
-            "--disable-openmp",
+            "--{}-openmp".format("enable" if self.options.with_openmp else "disable"),
             "--disable-docs",
             "--with-perl=no",
             "--with-x=no",
@@ -462,6 +471,9 @@ class ImageMagicConan(ConanFile):
         if self.options.with_freetype:
             core_requires.append("freetype::freetype")
 
+        if self._use_llvm_openmp:
+            core_requires.append("llvm-openmp::llvm-openmp")
+
         if self._is_msvc:
             if not self.options.shared:
                 self.cpp_info.components["MagickCore"].libs.append(
@@ -469,6 +481,10 @@ class ImageMagicConan(ConanFile):
                 )
         if self.settings.os == "Linux":
             self.cpp_info.components["MagickCore"].system_libs.append("pthread")
+        if not self.options.shared and self.options.with_openmp and self.settings.compiler == "gcc":
+            # The static libraries need libgomp (clang uses llvm-openmp)
+            self.cpp_info.components["MagickCore"].exelinkflags = ["-fopenmp"]
+            self.cpp_info.components["MagickCore"].sharedlinkflags = ["-fopenmp"]
 
         self.cpp_info.components["MagickCore"].defines.append(
             "MAGICKCORE_QUANTUM_DEPTH=%s" % self.options.quantum_depth
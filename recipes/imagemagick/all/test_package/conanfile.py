@@ -14,7 +14,12 @@ class TestPackageConan(ConanFile):
     def test(self):
         if not tools.cross_building(self):
             bin_path = os.path.join("bin", "test_package")
-            self.run(bin_path, run_environment=True)
+            with tools.environment_append({"MAGICK_THREAD_LIMIT": "4"}):
+                self.run(bin_path, run_environment=True)
+            if self.options["imagemagick"].with_openmp:
+                with open("features.txt") as f:
+                    if "OpenMP" not in f.read():
+                        raise Exception("feature OpenMP wasn't enabled!")
             with open('delegates.txt') as f:
                 content = f.read()
 
@@ -1,7 +1,7 @@
 #include <stdio.h>
 #include <MagickCore/MagickCore.h>
 
-int main()
+int main(int argc, char **argv)
 {
     size_t version, range, depth;
     printf("Imagemagick version      : %s\n", GetMagickVersion(&version));
@@ -20,5 +20,33 @@ int main()
     fputs(GetMagickDelegates(), fp);
     fclose(fp);
 
+    fp = fopen("features.txt", "w+");
+    fputs(GetMagickFeatures(), fp);
+    fclose(fp);
+
+    /* Resize a generated image, using up to MAGICK_THREAD_LIMIT threads */
+    MagickCoreGenesis(argv[0], MagickFalse);
+    ExceptionInfo *exception = AcquireExceptionInfo();
+    ImageInfo *image_info = CloneImageInfo(NULL);
+    Image *image = AcquireImage(image_info, exception);
+    if (SetImageExtent(image, 1024, 768, exception) == MagickFalse ||
+        SetImageBackgroundColor(image, exception) == MagickFalse) {
+        CatchException(exception);
+        return 1;
+    }
+    Image *resized = ResizeImage(image, 320, 240, LanczosFilter, exception);
+    if (resized == NULL) {
+        CatchException(exception);
+        return 1;
+    }
+    printf("ImageMagick threads      : %.20g\n", (double) GetMagickResourceLimit(ThreadResource));
+    printf("ImageMagick resized image: %.20gx%.20g\n", (double) resized->columns, (double) resized->rows);
+
+    resized = DestroyImage(resized);
+    image = DestroyImage(image);
+    image_info = DestroyImageInfo(image_info);
+    exception = DestroyExceptionInfo(exception);
+    MagickCoreTerminus();
+
     return 0;
 }
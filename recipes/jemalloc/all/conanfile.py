@@ -7,6 +7,7 @@ from conan.tools.files import export_conandata_patches, apply_conandata_patches,
 from conan.tools.microsoft import is_msvc, is_msvc_static_runtime
 from conan.tools.scm import Version
 import os
+import re
 import shutil
 
 required_conan_version = ">=1.54.0"
@@ -35,6 +36,10 @@ class JemallocConan(ConanFile):
         "enable_initial_exec_tls": [True, False],
         "enable_libdl": [True, False],
         "enable_prof": [True, False],
+        "malloc_conf": [None, "ANY"],
+        "lg_page": [None, "ANY"],
+        "lg_hugepage": [None, "ANY"],
+        "lg_quantum": [None, "ANY"],
     }
     default_options = {
         "shared": False,
@@ -50,6 +55,10 @@ class JemallocConan(ConanFile):
         "enable_initial_exec_tls": True,
         "enable_libdl": True,
         "enable_prof": False,
+        "malloc_conf": None,
+        "lg_page": None,
+        "lg_hugepage": None,
+        "lg_quantum": None,
     }
 
     @property
@@ -64,6 +73,15 @@ class JemallocConan(ConanFile):
             "msvc": "191",
         }
 
+    @property
+    def _lg_options_ranges(self):
+        # Base 2 logarithms accepted for --with-lg-page, --with-lg-hugepage and --with-lg-quantum
+        return {
+            "lg_page": (12, 16),       # 4 KiB to 64 KiB pages
+            "lg_hugepage": (16, 30),   # 64 KiB to 1 GiB huge pages
+            "lg_quantum": (3, 4),      # 8 or 16 bytes allocation alignment
+        }
+
     @property
     def _settings_build(self):
         return getattr(self, "settings_build", self.settings)
@@ -124,6 +142,21 @@ class JemallocConan(ConanFile):
         if self.settings.os == "Macos" and self.settings.arch == "armv8":
             if Version(self.version) < "5.3.0":
                 raise ConanInvalidConfiguration("Support for Apple Silicon is only available as of 5.3.0.")
+        # 4. Build-time tuning
+        if self.options.malloc_conf:
+            # Comma separated list of option:value pairs, see https://jemalloc.net/jemalloc.3.html#tuning
+            if not re.fullmatch(r"[a-z_]+:[^,:\s]+(,[a-z_]+:[^,:\s]+)*", str(self.options.malloc_conf)):
+                raise ConanInvalidConfiguration(
+                    f"malloc_conf must be a comma separated list of option:value pairs, got '{self.options.malloc_conf}'")
+        for option, (minimum, maximum) in self._lg_options_ranges.items():
+            value = str(self.options.get_safe(option))
+            if value == "None":
+                continue
+            if not value.isdigit() or not minimum <= int(value) <= maximum:
+                raise ConanInvalidConfiguration(f"{option} must be an integer between {minimum} and {maximum}, got '{value}'")
+        if str(self.options.lg_page) != "None" and str(self.options.lg_hugepage) != "None":
+            if int(self.options.lg_hugepage) < int(self.options.lg_page):
+                raise ConanInvalidConfiguration("lg_hugepage must not be smaller than lg_page")
 
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
@@ -147,6 +180,15 @@ class JemallocConan(ConanFile):
             enable_disable("libdl", self.options.enable_libdl),
             enable_disable("prof", self.options.enable_prof),
         ])
+        if self.options.malloc_conf:
+            tc.configure_args.append(f"--with-malloc-conf={self.options.malloc_conf}")
+        # Needed when cross-building, as configure cannot detect the page size of the target host
+        if str(self.options.lg_page) != "None":
+            tc.configure_args.append(f"--with-lg-page={self.options.lg_page}")
+        if str(self.options.lg_hugepage) != "None":
+            tc.configure_args.append(f"--with-lg-hugepage={self.options.lg_hugepage}")
+        if str(self.options.lg_quantum) != "None":
+            tc.configure_args.append(f"--with-lg-quantum={self.options.lg_quantum}")
         env = tc.environment()
         if is_msvc(self):
             # Do not check whether the math library exists when compiled by MSVC
@@ -1,5 +1,6 @@
 #include <jemalloc/jemalloc.h>
 
+#include <stdio.h>
 #include <stdlib.h>
 
 void do_something(size_t i) {
@@ -12,6 +13,18 @@ int main() {
         do_something(i);
     }
 
+    // Report the build-time configuration.
+    const char *malloc_conf = NULL;
+    size_t page = 0;
+    size_t sz = sizeof(malloc_conf);
+    if (mallctl("config.malloc_conf", &malloc_conf, &sz, NULL, 0) == 0) {
+        printf("config.malloc_conf: \"%s\"\n", malloc_conf);
+    }
+    sz = sizeof(page);
+    if (mallctl("arenas.page", &page, &sz, NULL, 0) == 0) {
+        printf("arenas.page: %zu\n", page);
+    }
+
     // Dump allocator statistics to stderr.
     malloc_stats_print(NULL, NULL, NULL);
 
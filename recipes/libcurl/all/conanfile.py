@@ -8,6 +8,7 @@ from conan.tools.files import copy, download, get, load, replace_in_file, rm, rm
 from conan.tools.gnu import Autotools, AutotoolsToolchain, AutotoolsDeps, PkgConfigDeps
 from conan.tools.layout import basic_layout
 from conan.tools.microsoft import is_msvc, unix_path
+from conan.tools.scm import Version
 
 import os
 import re
@@ -53,6 +54,7 @@ class LibcurlConan(ConanFile):
         "with_libpsl": [True, False],
         "with_largemaxwritesize": [True, False],
         "with_nghttp2": [True, False],
+        "with_http3": [True, False],
         "with_zlib": [True, False],
         "with_brotli": [True, False],
         "with_zstd": [True, False],
@@ -102,6 +104,7 @@ class LibcurlConan(ConanFile):
         "with_libpsl": False,
         "with_largemaxwritesize": False,
         "with_nghttp2": False,
+        "with_http3": False,
         "with_zlib": True,
         "with_brotli": False,
         "with_zstd": False,
@@ -170,6 +173,9 @@ class LibcurlConan(ConanFile):
             self.requires("mbedtls/3.5.0")
         if self.options.with_nghttp2:
             self.requires("libnghttp2/[>=1.59.0 <2]")
+        if self.options.with_http3:
+            self.requires("ngtcp2/1.12.0")
+            self.requires("nghttp3/[>=1.1.0 <2]")
         if self.options.with_libssh2:
             self.requires("libssh2/1.11.0")
         if self.options.with_zlib:
@@ -197,6 +203,13 @@ class LibcurlConan(ConanFile):
                 raise ConanInvalidConfiguration("option with_ntlm=True requires openssl/*:no_des=False")
         if self.options.with_ssl == "wolfssl" and not self.dependencies["wolfssl"].options.with_curl:
             raise ConanInvalidConfiguration("option with_ssl=wolfssl requires wolfssl/*:with_curl=True")
+        if self.options.with_http3:
+            if self.options.with_ssl != "openssl":
+                raise ConanInvalidConfiguration("option with_http3=True requires with_ssl=openssl")
+            if Version(self.dependencies["openssl"].ref.version) < "3.5.0":
+                raise ConanInvalidConfiguration("option with_http3=True requires openssl>=3.5.0 (QUIC TLS API)")
+            if not self.dependencies["ngtcp2"].options.with_openssl:
+                raise ConanInvalidConfiguration("option with_http3=True requires ngtcp2/*:with_openssl=True")
 
     def build_requirements(self):
         if self._is_using_cmake_build:
@@ -433,6 +446,14 @@ class LibcurlConan(ConanFile):
         else:
             tc.configure_args.append("--without-nghttp2")
 
+        if self.options.with_http3:
+            path = unix_path(self, self.dependencies["ngtcp2"].package_folder)
+            tc.configure_args.append(f"--with-ngtcp2={path}")
+            path = unix_path(self, self.dependencies["nghttp3"].package_folder)
+            tc.configure_args.append(f"--with-nghttp3={path}")
+        else:
+            tc.configure_args.extend(["--without-ngtcp2", "--without-nghttp3"])
+
         if self.options.with_zlib:
             path = unix_path(self, self.dependencies["zlib"].package_folder)
             tc.configure_args.append(f"--with-zlib={path}")
@@ -522,6 +543,9 @@ class LibcurlConan(ConanFile):
 
         tc.generate(env)
         tc = PkgConfigDeps(self)
+        if self.options.with_http3:
+            # curl's configure looks for the upstream pkg-config name
+            tc.set_property("nghttp3", "pkg_config_name", "libnghttp3")
         tc.generate()
         tc = AutotoolsDeps(self)
         tc.generate()
@@ -566,6 +590,8 @@ class LibcurlConan(ConanFile):
         tc.variables["CURL_USE_WOLFSSL"] = self.options.with_ssl == "wolfssl"
         tc.variables["CURL_USE_MBEDTLS"] = self.options.with_ssl == "mbedtls"
         tc.variables["USE_NGHTTP2"] = self.options.with_nghttp2
+        tc.variables["USE_NGTCP2"] = self.options.with_http3
+        tc.variables["USE_NGHTTP3"] = self.options.with_http3
         tc.variables["CURL_ZLIB"] = self.options.with_zlib
         tc.variables["CURL_BROTLI"] = self.options.with_brotli
         tc.variables["CURL_ZSTD"] = self.options.with_zstd
@@ -640,6 +666,15 @@ class LibcurlConan(ConanFile):
         if self.options.with_libidn:
             deps.set_property("libidn2", "cmake_file_name", "Libidn2")
             deps.set_property("libidn2", "cmake_additional_variables_prefixes", ["LIBIDN2"])
+
+        if self.options.with_http3:
+            # Replace curl's FindNGTCP2.cmake and FindNGHTTP3.cmake
+            deps.set_property("ngtcp2", "cmake_file_name", "NGTCP2")
+            deps.set_property("ngtcp2", "cmake_additional_variables_prefixes", ["NGTCP2",])
+            deps.set_property("ngtcp2", "cmake_extra_variables", {"NGTCP2_FOUND": "1", "NGTCP2_VERSION": str(self.dependencies["ngtcp2"].ref.version)})
+            deps.set_property("nghttp3", "cmake_file_name", "NGHTTP3")
+            deps.set_property("nghttp3", "cmake_additional_variables_prefixes", ["NGHTTP3",])
+            deps.set_property("nghttp3", "cmake_extra_variables", {"NGHTTP3_FOUND": "1", "NGHTTP3_VERSION": str(self.dependencies["nghttp3"].ref.version)})
         deps.generate()
 
     def package(self):
@@ -714,6 +749,8 @@ class LibcurlConan(ConanFile):
             self.cpp_info.components["curl"].requires.append("mbedtls::mbedtls")
         if self.options.with_nghttp2:
             self.cpp_info.components["curl"].requires.append("libnghttp2::libnghttp2")
+        if self.options.with_http3:
+            self.cpp_info.components["curl"].requires.extend(["ngtcp2::ngtcp2", "nghttp3::nghttp3"])
         if self.options.with_libssh2:
             self.cpp_info.components["curl"].requires.append("libssh2::libssh2")
         if self.options.with_zlib:
@@ -1,8 +1,56 @@
 #include <stdio.h>
 #include <curl/curl.h>
 
+#if defined(TEST_LIBCURL_HTTP3)
+static int check_http3(void)
+{
+  const curl_version_info_data *info = curl_version_info(CURLVERSION_NOW);
+  CURL *curl;
+  CURLcode res;
+
+  if(!(info->features & CURL_VERSION_HTTP3)) {
+    printf("libcurl was built without HTTP/3 support\n");
+    return 1;
+  }
+  printf("HTTP/3 support: %s\n", info->quic_version ? info->quic_version : "unknown");
+
+  /* setting an HTTP/3-only transfer fails unless a QUIC backend is linked */
+  curl = curl_easy_init();
+  if(!curl)
+    return 1;
+  res = curl_easy_setopt(curl, CURLOPT_HTTP_VERSION, (long)CURL_HTTP_VERSION_3ONLY);
+  if(res != CURLE_OK) {
+    printf("CURL_HTTP_VERSION_3ONLY rejected: %s\n", curl_easy_strerror(res));
+    curl_easy_cleanup(curl);
+    return 1;
+  }
+
+  /* loopback transfer: no QUIC server is available, but the QUIC handshake
+     must be attempted over UDP and fail to connect, instead of the
+     transfer being refused as unsupported */
+  curl_easy_setopt(curl, CURLOPT_URL, "https://127.0.0.1:9/");
+  curl_easy_setopt(curl, CURLOPT_CONNECTTIMEOUT_MS, 2000L);
+  res = curl_easy_perform(curl);
+  curl_easy_cleanup(curl);
+  printf("HTTP/3 loopback transfer: %s\n", curl_easy_strerror(res));
+  switch(res) {
+  case CURLE_COULDNT_CONNECT:
+  case CURLE_QUIC_CONNECT_ERROR:
+  case CURLE_OPERATION_TIMEDOUT:
+  case CURLE_RECV_ERROR:
+    return 0;
+  default:
+    return 1;
+  }
+}
+#endif
+
 int main(void)
 {
   printf("libcurl version %s\n", curl_version());
+#if defined(TEST_LIBCURL_HTTP3)
+  if(check_http3())
+    return 1;
+#endif
   return 0;
 }
@@ -27,10 +27,36 @@ class LibVPXConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "realtime_only": [True, False],
+        "runtime_cpu_detect": [True, False],
+        "multithread": [True, False],
+        "postproc": [True, False],
+        "size_limit": [None, "ANY"],
+        "vp8_encoder": [True, False],
+        "vp8_decoder": [True, False],
+        "vp9_encoder": [True, False],
+        "vp9_decoder": [True, False],
+        "build_tools": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "realtime_only": False,
+        "runtime_cpu_detect": True,
+        "multithread": True,
+        "postproc": False,
+        "size_limit": None,
+        "vp8_encoder": True,
+        "vp8_decoder": True,
+        "vp9_encoder": True,
+        "vp9_decoder": True,
+        "build_tools": False,
+    }
+    options_description = {
+        "realtime_only": "Only build the encoder features used in real-time mode (--enable-realtime-only)",
+        "runtime_cpu_detect": "Select the SIMD implementations at runtime (--enable-runtime-cpu-detect)",
+        "size_limit": "Maximum frame size accepted by the decoders, as 'WIDTHxHEIGHT' (--size-limit)",
+        "build_tools": "Build and package the vpxenc/vpxdec tools",
     }
 
     _arch_options = ['mmx', 'sse', 'sse2', 'sse3', 'ssse3', 'sse4_1', 'avx', 'avx2', 'avx512']
@@ -42,6 +68,23 @@ class LibVPXConan(ConanFile):
     def _settings_build(self):
         return getattr(self, "settings_build", self.settings)
 
+    @property
+    def _codecs(self):
+        return ["vp8_encoder", "vp8_decoder", "vp9_encoder", "vp9_decoder"]
+
+    @property
+    def _with_vp9(self):
+        return self.options.vp9_encoder or self.options.vp9_decoder
+
+    @property
+    def _tools(self):
+        tools = []
+        if self.options.vp8_encoder or self.options.vp9_encoder:
+            tools.append("vpxenc")
+        if self.options.vp8_decoder or self.options.vp9_decoder:
+            tools.append("vpxdec")
+        return tools
+
     def config_options(self):
         if self.settings.os == 'Windows':
             del self.options.fPIC
@@ -67,6 +110,10 @@ class LibVPXConan(ConanFile):
             raise ConanInvalidConfiguration(f"Unsupported compiler {self.settings.compiler}")
         if self.settings.os == "iOS" and (self.settings.os.sdk != "iphonesimulator" and self.settings.arch in ["x86_64", "x86"]):
             raise ConanInvalidConfiguration("iOS platform with x86/x86_64 architectures only supports 'iphonesimulator' SDK option")
+        if not any(self.options.get_safe(codec) for codec in self._codecs):
+            raise ConanInvalidConfiguration(f"{self.ref} requires at least one of the options {', '.join(self._codecs)}")
+        if self.options.size_limit and not re.match(r"^[1-9][0-9]*x[1-9][0-9]*$", str(self.options.size_limit)):
+            raise ConanInvalidConfiguration(f"{self.ref} option size_limit must be 'WIDTHxHEIGHT', e.g. '1920x1080'")
 
     def build_requirements(self):
         self.tool_requires("yasm/1.3.0")
@@ -133,14 +180,25 @@ class LibVPXConan(ConanFile):
             # special case, as gcc/g++ is hard-coded in makefile, it implicitly assumes -lstdc++
             tc.extra_ldflags.append("-stdlib=libc++")
 
+        def enable_disable(opt): return "enable" if opt else "disable"
         tc.configure_args.extend([
             "--disable-examples",
             "--disable-unit-tests",
-            "--disable-tools",
+            f"--{enable_disable(self.options.build_tools)}-tools",
             "--disable-docs",
-            "--enable-vp9-highbitdepth",
             "--as=yasm",
+            f"--{enable_disable(self.options.realtime_only)}-realtime-only",
+            f"--{enable_disable(self.options.runtime_cpu_detect)}-runtime-cpu-detect",
+            f"--{enable_disable(self.options.multithread)}-multithread",
+            f"--{enable_disable(self.options.postproc)}-postproc",
         ])
+        for codec in self._codecs:
+            tc.configure_args.append(f"--{enable_disable(self.options.get_safe(codec))}-{codec.replace('_', '-')}")
+        if self._with_vp9:
+            tc.configure_args.append("--enable-vp9-highbitdepth")
+            tc.configure_args.append(f"--{enable_disable(self.options.postproc)}-vp9-postproc")
+        if self.options.size_limit:
+            tc.configure_args.append(f"--size-limit={self.options.size_limit}")
         # Note for MSVC: release libs are always built, we just avoid keeping the release lib
         # Note2: Can't use --enable-debug_libs (to help install on Windows),
         #     the makefile's install step fails as it wants to install a library that doesn't exist.
@@ -246,10 +304,17 @@ class LibVPXConan(ConanFile):
             # Copy for msvc, as it will generate a release and debug library, so take what we want
             # Note that libvpx's configure/make doesn't support shared lib builds on windows yet.
             copy(self, f"{self._lib_name}.lib", libs_from, os.path.join(self.package_folder, "lib"))
+            tools_from = libs_from
         else:
             # if not msvc, then libs were installed into package (in the wrong place), move them
             libs_from = os.path.join(self.package_folder, self._install_tmp_folder, "lib")
             rename(self, libs_from, os.path.join(self.package_folder, "lib"))
+            tools_from = self.build_folder
+
+        if self.options.build_tools:
+            ext = ".exe" if self.settings.os == "Windows" else ""
+            for tool in self._tools:
+                copy(self, f"{tool}{ext}", tools_from, os.path.join(self.package_folder, "bin"), keep_path=False)
 
         rmdir(self, os.path.join(self.package_folder, self._install_tmp_folder))
         rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
@@ -264,4 +329,6 @@ class LibVPXConan(ConanFile):
             if libcxx:
                 self.cpp_info.system_libs.append(libcxx)
         if self.settings.os in ["Linux", "FreeBSD"]:
-            self.cpp_info.system_libs.extend(["m", "pthread"])
+            self.cpp_info.system_libs.append("m")
+            if self.options.multithread:
+                self.cpp_info.system_libs.append("pthread")
@@ -5,5 +5,6 @@
 int main()
 {
     printf("vpx version %s\n", vpx_codec_version_str());
+    printf("vpx build config: %s\n", vpx_codec_build_config());
     return 0;
 }
@@ -23,6 +23,8 @@ class LibwebpConan(ConanFile):
         "with_simd": [True, False],
         "near_lossless": [True, False],
         "swap_16bit_csp": [True, False],
+        "with_threads": [True, False],
+        "build_tools": [True, False],
     }
     default_options = {
         "shared": False,
@@ -30,6 +32,8 @@ class LibwebpConan(ConanFile):
         "with_simd": True,
         "near_lossless": True,
         "swap_16bit_csp": False,
+        "with_threads": True,
+        "build_tools": False,
     }
 
     def export_sources(self):
@@ -62,18 +66,21 @@ class LibwebpConan(ConanFile):
         tc.variables["WEBP_ENABLE_SIMD"] = self.options.with_simd
         tc.variables["WEBP_NEAR_LOSSLESS"] = self.options.near_lossless
         tc.variables["WEBP_ENABLE_SWAP_16BIT_CSP"] = self.options.swap_16bit_csp
+        tc.variables["WEBP_USE_THREAD"] = self.options.with_threads
         # avoid finding system libs
         tc.variables["CMAKE_DISABLE_FIND_PACKAGE_GIF"] = True
         tc.variables["CMAKE_DISABLE_FIND_PACKAGE_PNG"] = True
         tc.variables["CMAKE_DISABLE_FIND_PACKAGE_TIFF"] = True
         tc.variables["CMAKE_DISABLE_FIND_PACKAGE_JPEG"] = True
         tc.variables["WEBP_BUILD_ANIM_UTILS"] = False
-        tc.variables["WEBP_BUILD_CWEBP"] = False
-        tc.variables["WEBP_BUILD_DWEBP"] = False
+        # cwebp, dwebp and get_disto (from the extras), without the optional image formats
+        tc.variables["WEBP_BUILD_CWEBP"] = self.options.build_tools
+        tc.variables["WEBP_BUILD_DWEBP"] = self.options.build_tools
         tc.variables["WEBP_BUILD_IMG2WEBP"] = False
         tc.variables["WEBP_BUILD_GIF2WEBP"] = False
         tc.variables["WEBP_BUILD_VWEBP"] = False
-        tc.variables["WEBP_BUILD_EXTRAS"] = False
+        tc.variables["WEBP_BUILD_EXTRAS"] = self.options.build_tools
+        tc.variables["CMAKE_DISABLE_FIND_PACKAGE_SDL"] = True
         tc.variables["WEBP_BUILD_WEBPINFO"] = False
         if Version(self.version) >= "1.2.1":
             tc.variables["WEBP_BUILD_LIBWEBPMUX"] = True
@@ -92,9 +99,17 @@ class LibwebpConan(ConanFile):
         cmake = CMake(self)
         cmake.install()
         copy(self, "COPYING", src=self.source_folder, dst=os.path.join(self.package_folder, "licenses"))
+        if self.options.build_tools:
+            # get_disto is not installed by upstream
+            ext = ".exe" if self.settings.os == "Windows" else ""
+            copy(self, f"*get_disto{ext}", src=self.build_folder, dst=os.path.join(self.package_folder, "bin"), keep_path=False)
         rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
         rmdir(self, os.path.join(self.package_folder, "share"))
 
+    @property
+    def _pthread(self):
+        return ["pthread"] if self.options.with_threads else []
+
     def package_info(self):
         self.cpp_info.set_property("cmake_file_name", "WebP")
         self.cpp_info.set_property("pkg_config_name", "libwebp-all-do-not-use")
@@ -105,7 +120,7 @@ class LibwebpConan(ConanFile):
         self.cpp_info.components["webpdecoder"].set_property("pkg_config_name", "libwebpdecoder")
         self.cpp_info.components["webpdecoder"].libs = ["webpdecoder"]
         if self.settings.os in ["Linux", "FreeBSD"]:
-            self.cpp_info.components["webpdecoder"].system_libs = ["m", "pthread"]
+            self.cpp_info.components["webpdecoder"].system_libs = ["m"] + self._pthread
         if self.settings.os == "Android":
             self.cpp_info.components["webpdecoder"].system_libs = ["m"]
 
@@ -114,7 +129,7 @@ class LibwebpConan(ConanFile):
         self.cpp_info.components["webp"].set_property("pkg_config_name", "libwebp")
         self.cpp_info.components["webp"].libs = ["webp"]
         if self.settings.os in ["Linux", "FreeBSD"]:
-            self.cpp_info.components["webp"].system_libs = ["m", "pthread"]
+            self.cpp_info.components["webp"].system_libs = ["m"] + self._pthread
         if self.settings.os == "Android":
             self.cpp_info.components["webp"].system_libs = ["m"]
 
@@ -124,7 +139,7 @@ class LibwebpConan(ConanFile):
             self.cpp_info.components["sharpyuv"].set_property("pkg_config_name", "libsharpyuv")
             self.cpp_info.components["sharpyuv"].libs = ["sharpyuv"]
             if self.settings.os in ["Linux", "FreeBSD"]:
-                self.cpp_info.components["sharpyuv"].system_libs = ["m", "pthread"]
+                self.cpp_info.components["sharpyuv"].system_libs = ["m"] + self._pthread
             if self.settings.os == "Android":
                 self.cpp_info.components["sharpyuv"].system_libs = ["m"]
             # note: webp now depends on sharpyuv
@@ -24,3 +24,6 @@ class TestPackageConan(ConanFile):
         if can_run(self):
             bin_path = os.path.join(self.cpp.build.bindirs[0], "test_package")
             self.run(bin_path, env="conanrun")
+            if self.dependencies["libwebp"].options.build_tools:
+                self.run("cwebp -version", env="conanrun")
+                self.run("dwebp -version", env="conanrun")
@@ -29,6 +29,11 @@ class MimallocConan(ConanFile):
         "single_object": [True, False],
         "guarded": [True, False],
         "win_redirect": [True, False],
+        "opt_arch": [True, False],
+        "opt_simd": [True, False],
+        "large_os_pages": [None, True, False],
+        "reserve_huge_os_pages": [None, "ANY"],
+        "arena_eager_commit": [None, 0, 1, 2],
     }
     default_options = {
         "shared": False,
@@ -39,6 +44,12 @@ class MimallocConan(ConanFile):
         "single_object": False,
         "guarded": False,
         "win_redirect": False,
+        "opt_arch": False,
+        "opt_simd": False,
+        # None keeps the upstream default of the runtime option
+        "large_os_pages": None,
+        "reserve_huge_os_pages": None,
+        "arena_eager_commit": None,
     }
 
     def export_sources(self):
@@ -57,6 +68,16 @@ class MimallocConan(ConanFile):
             del self.options.inject
         if Version(self.version) < "2.1.9":
             del self.options.guarded
+        # MI_OPT_ARCH only has an effect on x86_64 (AVX2) and arm64 (armv8.1-a)
+        if Version(self.version) < "2.1.9" or self.settings.arch not in ["x86_64", "armv8"]:
+            del self.options.opt_arch
+        if Version(self.version) < "2.2.0" or self.settings.arch not in ["x86_64", "armv8"]:
+            del self.options.opt_simd
+        # Compile-time defaults of the runtime options (MI_DEFAULT_* macros in src/options.c)
+        if Version(self.version) < "2.1.7":
+            del self.options.large_os_pages
+            del self.options.reserve_huge_os_pages
+            del self.options.arena_eager_commit
 
     def configure(self):
         if self.options.shared:
@@ -111,6 +132,14 @@ class MimallocConan(ConanFile):
            self.options.get_safe("inject"):
             raise ConanInvalidConfiguration("Single object is incompatible with library injection")
 
+        if self.options.get_safe("opt_simd") and not self.options.get_safe("opt_arch"):
+            raise ConanInvalidConfiguration("opt_simd requires opt_arch=True")
+
+        reserve_huge_os_pages = str(self.options.get_safe("reserve_huge_os_pages"))
+        if reserve_huge_os_pages != "None" and not reserve_huge_os_pages.isdigit():
+            raise ConanInvalidConfiguration(
+                f"reserve_huge_os_pages must be a number of 1GiB pages, got '{reserve_huge_os_pages}'")
+
     def build_requirements(self):
         self.tool_requires("cmake/[>=3.18 <4]")
 
@@ -128,6 +157,20 @@ class MimallocConan(ConanFile):
         tc.variables["MI_WIN_REDIRECT"] = "ON" if self.options.get_safe("win_redirect") else "OFF"
         tc.variables["MI_INSTALL_TOPLEVEL"] = "ON"
         tc.variables["MI_GUARDED"] = self.options.get_safe("guarded", False)
+        if self.options.get_safe("opt_arch") is not None:
+            tc.variables["MI_OPT_ARCH"] = self.options.opt_arch
+        if self.options.get_safe("opt_simd") is not None:
+            tc.variables["MI_OPT_SIMD"] = self.options.opt_simd
+        # Only override the defaults of the runtime options that were explicitly set
+        large_os_pages = str(self.options.get_safe("large_os_pages"))
+        if large_os_pages != "None":
+            tc.preprocessor_definitions["MI_DEFAULT_ALLOW_LARGE_OS_PAGES"] = 1 if large_os_pages == "True" else 0
+        arena_eager_commit = str(self.options.get_safe("arena_eager_commit"))
+        if arena_eager_commit != "None":
+            tc.preprocessor_definitions["MI_DEFAULT_ARENA_EAGER_COMMIT"] = arena_eager_commit
+        reserve_huge_os_pages = str(self.options.get_safe("reserve_huge_os_pages"))
+        if reserve_huge_os_pages != "None":
+            tc.preprocessor_definitions["MI_DEFAULT_RESERVE_HUGE_OS_PAGES"] = reserve_huge_os_pages
         if Version(self.version) <= "1.7.6":
             tc.cache_variables["CMAKE_POLICY_VERSION_MINIMUM"] = "3.5" # CMake 4 support
         tc.generate()
@@ -1,12 +1,12 @@
 from conan import ConanFile
 from conan.tools.build import can_run
-from conan.tools.cmake import CMake, cmake_layout
+from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
 import os
 
 
 class TestPackageConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
-    generators = "CMakeToolchain", "CMakeDeps", "VirtualRunEnv"
+    generators = "CMakeDeps", "VirtualRunEnv"
 
     def layout(self):
         cmake_layout(self)
@@ -14,6 +14,20 @@ class TestPackageConan(ConanFile):
     def requirements(self):
         self.requires(self.tested_reference_str)
 
+    def generate(self):
+        mimalloc_options = self.dependencies["mimalloc"].options
+        tc = CMakeToolchain(self)
+        tc.cache_variables["MIMALLOC_INJECT"] = bool(mimalloc_options.get_safe("inject"))
+        large_os_pages = str(mimalloc_options.get_safe("large_os_pages"))
+        if large_os_pages != "None":
+            tc.cache_variables["MIMALLOC_LARGE_OS_PAGES"] = "1" if large_os_pages == "True" else "0"
+        arena_eager_commit = str(mimalloc_options.get_safe("arena_eager_commit"))
+        if arena_eager_commit != "None":
+            tc.cache_variables["MIMALLOC_ARENA_EAGER_COMMIT"] = arena_eager_commit
+        tc.cache_variables["MIMALLOC_OPT_ARCH"] = bool(mimalloc_options.get_safe("opt_arch"))
+        tc.cache_variables["MIMALLOC_OPT_SIMD"] = bool(mimalloc_options.get_safe("opt_simd"))
+        tc.generate()
+
     def build(self):
         cmake = CMake(self)
         cmake.configure()
@@ -23,3 +37,6 @@ class TestPackageConan(ConanFile):
         if can_run(self):
             bin_path = os.path.join(self.cpp.build.bindir, "test_package")
             self.run(bin_path, env="conanrun")
+            if not self.dependencies["mimalloc"].options.get_safe("inject"):
+                bin_path = os.path.join(self.cpp.build.bindir, "test_options")
+                self.run(bin_path, env="conanrun")
@@ -0,0 +1,77 @@
+#include "mimalloc.h"
+
+#include <stdlib.h>
+#include <stdio.h>
+#include <string.h>
+
+#ifdef MIMALLOC_OPT_ARCH
+static int cpu_supports_opt_arch(void) {
+#if defined(__x86_64__) && defined(__GNUC__)
+    // MI_OPT_ARCH targets x86-64-v3 (haswell)
+    __builtin_cpu_init();
+    return __builtin_cpu_supports("avx2") && __builtin_cpu_supports("bmi2");
+#else
+    return 1;
+#endif
+}
+
+// Exercise the size classes, zeroing and reallocation paths, which is where
+// the arch/simd specific code (bit scans, bulk copy and clear) is used
+static int check_opt_arch(void) {
+    for (size_t size = 1; size <= 256 * 1024; size = size * 3 / 2 + 1) {
+        unsigned char *p = (unsigned char *)mi_zalloc(size);
+        if (p == NULL || mi_usable_size(p) < size) {
+            return 0;
+        }
+        for (size_t i = 0; i < size; ++i) {
+            if (p[i] != 0) {
+                return 0;
+            }
+        }
+        memset(p, 0x5a, size);
+        p = (unsigned char *)mi_realloc(p, 2 * size);
+        if (p == NULL) {
+            return 0;
+        }
+        for (size_t i = 0; i < size; ++i) {
+            if (p[i] != 0x5a) {
+                return 0;
+            }
+        }
+        mi_free(p);
+    }
+    return 1;
+}
+#endif
+
+int main() {
+    // Defaults baked in at build time, unless overridden by MIMALLOC_* environment variables
+#ifdef EXPECTED_LARGE_OS_PAGES
+    if (getenv("MIMALLOC_ALLOW_LARGE_OS_PAGES") == NULL && getenv("MIMALLOC_LARGE_OS_PAGES") == NULL &&
+        mi_option_get(mi_option_large_os_pages) != EXPECTED_LARGE_OS_PAGES) {
+        printf("unexpected large_os_pages default: %ld\n", mi_option_get(mi_option_large_os_pages));
+        return EXIT_FAILURE;
+    }
+    printf("large_os_pages: %ld\n", mi_option_get(mi_option_large_os_pages));
+#endif
+#ifdef EXPECTED_ARENA_EAGER_COMMIT
+    if (getenv("MIMALLOC_ARENA_EAGER_COMMIT") == NULL &&
+        mi_option_get(mi_option_arena_eager_commit) != EXPECTED_ARENA_EAGER_COMMIT) {
+        printf("unexpected arena_eager_commit default: %ld\n", mi_option_get(mi_option_arena_eager_commit));
+        return EXIT_FAILURE;
+    }
+    printf("arena_eager_commit: %ld\n", mi_option_get(mi_option_arena_eager_commit));
+#endif
+#ifdef MIMALLOC_OPT_ARCH
+    if (!cpu_supports_opt_arch()) {
+        printf("mimalloc was built with opt_arch, but this CPU does not support it: skipping\n");
+        return EXIT_SUCCESS;
+    }
+    if (!check_opt_arch()) {
+        printf("allocation check failed with opt_arch/opt_simd\n");
+        return EXIT_FAILURE;
+    }
+    printf("opt_arch/opt_simd allocation check passed\n");
+#endif
+    return EXIT_SUCCESS;
+}
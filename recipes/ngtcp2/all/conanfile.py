@@ -0,0 +1,111 @@
+from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
+from conan.tools.apple import is_apple_os
+from conan.tools.cmake import CMake, CMakeToolchain, CMakeDeps, cmake_layout
+from conan.tools.files import copy, get, rmdir
+from conan.tools.microsoft import is_msvc
+from conan.tools.scm import Version
+import os
+
+
+required_conan_version = ">=2"
+
+
+class Ngtcp2Conan(ConanFile):
+    name = "ngtcp2"
+    description = "ngtcp2 project is an effort to implement IETF QUIC protocol"
+    license = "MIT"
+    url = "https://github.com/conan-io/conan-center-index"
+    homepage = "https://nghttp2.org/ngtcp2/"
+    topics = ("quic", "http3", "networking")
+    package_type = "library"
+    settings = "os", "arch", "compiler", "build_type"
+    options = {
+        "shared": [True, False],
+        "fPIC": [True, False],
+        "with_openssl": [True, False],
+    }
+    default_options = {
+        "shared": False,
+        "fPIC": True,
+        "with_openssl": True,
+    }
+
+    def config_options(self):
+        if self.settings.os == "Windows":
+            del self.options.fPIC
+
+    def configure(self):
+        if self.options.shared:
+            self.options.rm_safe("fPIC")
+        self.settings.rm_safe("compiler.libcxx")
+        self.settings.rm_safe("compiler.cppstd")
+
+    def layout(self):
+        cmake_layout(self, src_folder="src")
+
+    def requirements(self):
+        if self.options.with_openssl:
+            # libngtcp2_crypto_ossl needs the QUIC TLS API introduced in OpenSSL 3.5
+            self.requires("openssl/[>=3.5 <4]", transitive_headers=True)
+
+    def validate(self):
+        if self.options.with_openssl and Version(self.dependencies["openssl"].ref.version) < "3.5.0":
+            raise ConanInvalidConfiguration(f"{self.ref} requires openssl>=3.5.0 for its crypto helper library")
+
+    def build_requirements(self):
+        self.tool_requires("cmake/[>=3.20 <4]")
+
+    def source(self):
+        get(self, **self.conan_data["sources"][self.version], strip_root=True)
+
+    def generate(self):
+        tc = CMakeToolchain(self)
+        tc.variables["ENABLE_SHARED_LIB"] = self.options.shared
+        tc.variables["ENABLE_STATIC_LIB"] = not self.options.shared
+        tc.variables["ENABLE_LIB_ONLY"] = True
+        tc.variables["ENABLE_OPENSSL"] = self.options.with_openssl
+        tc.variables["ENABLE_GNUTLS"] = False
+        tc.variables["ENABLE_BORINGSSL"] = False
+        tc.variables["ENABLE_PICOTLS"] = False
+        tc.variables["ENABLE_WOLFSSL"] = False
+        if is_apple_os(self):
+            # workaround for: install TARGETS given no BUNDLE DESTINATION for MACOSX_BUNDLE executable
+            tc.cache_variables["CMAKE_MACOSX_BUNDLE"] = False
+        tc.variables["BUILD_TESTING"] = False
+        tc.generate()
+        deps = CMakeDeps(self)
+        deps.generate()
+
+    def build(self):
+        cmake = CMake(self)
+        cmake.configure()
+        cmake.build()
+
+    def package(self):
+        copy(self, pattern="COPYING", dst=os.path.join(self.package_folder, "licenses"), src=self.source_folder)
+        cmake = CMake(self)
+        cmake.install()
+        rmdir(self, os.path.join(self.package_folder, "share"))
+        rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
+        rmdir(self, os.path.join(self.package_folder, "lib", "cmake"))
+
+    def package_info(self):
+        self.cpp_info.set_property("cmake_file_name", "ngtcp2")
+
+        self.cpp_info.components["ngtcp2_core"].set_property("cmake_target_name", "ngtcp2::ngtcp2_core")
+        self.cpp_info.components["ngtcp2_core"].set_property("pkg_config_name", "libngtcp2")
+        self.cpp_info.components["ngtcp2_core"].libs = ["ngtcp2"]
+        if is_msvc(self) and not self.options.shared:
+            self.cpp_info.components["ngtcp2_core"].defines.append("NGTCP2_STATICLIB")
+        if self.settings.os == "Windows":
+            self.cpp_info.components["ngtcp2_core"].system_libs.append("ws2_32")
+
+        if self.options.with_openssl:
+            self.cpp_info.components["crypto_ossl"].set_property("cmake_target_name", "ngtcp2::ngtcp2_crypto_ossl")
+            self.cpp_info.components["crypto_ossl"].set_property("pkg_config_name", "libngtcp2_crypto_ossl")
+            self.cpp_info.components["crypto_ossl"].libs = ["ngtcp2_crypto_ossl"]
+            self.cpp_info.components["crypto_ossl"].requires = ["ngtcp2_core", "openssl::ssl", "openssl::crypto"]
+
+        # trick for internal conan usage to pick up in downsteam pc files the pc file including all libs components
+        self.cpp_info.set_property("pkg_config_name", "libngtcp2")
@@ -0,0 +1,14 @@
+#include <stdio.h>
+
+#include <ngtcp2/ngtcp2.h>
+
+int main()
+{
+    const ngtcp2_info* info = ngtcp2_version(0);
+    if (info) {
+        printf("ngtcp2 ver=%d version=%s\n", info->version_num, info->version_str);
+    } else {
+        printf("ngtcp2: cannot get version\n");
+    }
+    return 0;
+}
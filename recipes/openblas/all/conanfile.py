@@ -75,6 +75,10 @@ class OpenblasConan(ConanFile):
         "build_relapack": [True, False],
         "use_thread": [True, False],
         "use_locking": [True, False],
+        "use_openmp": [True, False],
+        "num_threads": [None, "ANY"],
+        "num_parallel": [None, "ANY"],
+        "buffersize": [None, "ANY"],
         "dynamic_arch": [True, False],
         "target": [None] + available_openblas_targets
     }
@@ -85,6 +89,10 @@ class OpenblasConan(ConanFile):
         "build_relapack": False,
         "use_thread": True,
         "use_locking": True,
+        "use_openmp": False,
+        "num_threads": None,
+        "num_parallel": None,
+        "buffersize": None,
         "dynamic_arch": False,
         "target": None,
     }
@@ -93,6 +101,10 @@ class OpenblasConan(ConanFile):
         "build_relapack": "Build with ReLAPACK (recursive implementation of several LAPACK functions on top of standard LAPACK)",
         "use_thread": "Enable threads support",
         "use_locking": "Use locks even in single-threaded builds to make them callable from multiple threads",
+        "use_openmp": "Use OpenMP instead of pthreads as threading backend (requires use_thread)",
+        "num_threads": "Maximum number of threads (NUM_THREADS), defaults to the number of cores of the build machine",
+        "num_parallel": "Number of concurrent threads that may call OpenBLAS (NUM_PARALLEL), only useful with use_openmp",
+        "buffersize": "Base 2 logarithm of the per-thread memory buffer size (BUFFERSIZE)",
         "dynamic_arch": "Include support for multiple CPU targets, with automatic selection at runtime (x86/x86_64, aarch64 or ppc only)",
         "target": "OpenBLAS TARGET variable (see TargetList.txt)",
     }
@@ -132,6 +144,17 @@ class OpenblasConan(ConanFile):
             if self.settings.compiler not in ["gcc", "clang"]:
                 # ld: unknown option: --allow-multiple-definition on apple-clang
                 raise ConanInvalidConfiguration(f'"{self.name}/*:build_relapack=True" option is only supported for GCC and Clang')
+        if self.options.use_openmp:
+            if not self.options.use_thread:
+                raise ConanInvalidConfiguration(f'"{self.name}/*:use_openmp=True" option requires "{self.name}/*:use_thread=True"')
+            if self.settings.compiler == "apple-clang":
+                raise ConanInvalidConfiguration(f'"{self.name}/*:use_openmp=True" option is not supported by apple-clang')
+        for option in ["num_threads", "num_parallel", "buffersize"]:
+            value = str(self.options.get_safe(option))
+            if value != "None" and (not value.isdigit() or int(value) < 1):
+                raise ConanInvalidConfiguration(f'"{self.name}/*:{option}" option must be a positive integer, got "{value}"')
+        if self.options.num_parallel and not self.options.use_openmp:
+            self.output.warning(f'"{self.name}/*:num_parallel" option only has an effect with "{self.name}/*:use_openmp=True"')
 
     def validate_build(self):
         # If we're cross-compiling, and the user didn't provide the target, and
@@ -164,6 +187,14 @@ class OpenblasConan(ConanFile):
         tc.variables["DYNAMIC_ARCH"] = self.options.dynamic_arch
         tc.variables["USE_THREAD"] = self.options.use_thread
         tc.variables["USE_LOCKING"] = self.options.use_locking
+        tc.variables["USE_OPENMP"] = self.options.use_openmp
+        # Default values are taken from the build machine, which is rarely the deployment target
+        if self.options.num_threads:
+            tc.variables["NUM_THREADS"] = self.options.num_threads
+        if self.options.num_parallel:
+            tc.variables["NUM_PARALLEL"] = self.options.num_parallel
+        if self.options.buffersize:
+            tc.variables["BUFFERSIZE"] = self.options.buffersize
 
         tc.variables["MSVC_STATIC_CRT"] = is_msvc_static_runtime(self)
 
@@ -203,12 +234,16 @@ class OpenblasConan(ConanFile):
         # CMake config file:
         # - OpenBLAS always has one and only one of these components: openmp, pthread or serial.
         # - Whatever if this component is requested or not, official CMake imported target is always OpenBLAS::OpenBLAS
-        # - TODO: add openmp component when implemented in this recipe
         self.cpp_info.set_property("cmake_file_name", "OpenBLAS")
         self.cpp_info.set_property("cmake_target_name", "OpenBLAS::OpenBLAS")
         self.cpp_info.set_property("pkg_config_name", "openblas")
         # 'pthread' causes issues without namespace
-        cmake_component_name = "pthread" if self.options.use_thread else "serial"  # TODO: how to model this in CMakeDeps?
+        if self.options.use_openmp:
+            cmake_component_name = "openmp"
+        elif self.options.use_thread:
+            cmake_component_name = "pthread"
+        else:
+            cmake_component_name = "serial"  # TODO: how to model this in CMakeDeps?
         self.cpp_info.components["openblas_component"].set_property("cmake_target_name", f"OpenBLAS::{cmake_component_name}")
         self.cpp_info.components["openblas_component"].set_property("pkg_config_name", "openblas")
         self.cpp_info.components["openblas_component"].includedirs.append(os.path.join("include", "openblas"))
@@ -219,6 +254,10 @@ class OpenblasConan(ConanFile):
                 self.cpp_info.components["openblas_component"].system_libs.append("pthread")
             if self.options.build_lapack and self._fortran_compiler:
                 self.cpp_info.components["openblas_component"].system_libs.append("gfortran")
+        if self.options.use_openmp and not is_msvc(self):
+            # MSVC objects already carry a default library directive for the OpenMP runtime
+            self.cpp_info.components["openblas_component"].exelinkflags.append("-fopenmp")
+            self.cpp_info.components["openblas_component"].sharedlinkflags.append("-fopenmp")
 
         self.buildenv_info.define_path("OpenBLAS_HOME", self.package_folder)
         self.runenv_info.define_path("OpenBLAS_HOME", self.package_folder)
@@ -12,4 +12,7 @@ int main()
   for(i=0; i<9; i++)
     printf("%lf ", C[i]);
   printf("\n");
+
+  // 0: sequential, 1: pthreads, 2: OpenMP
+  printf("parallel: %d, threads: %d\n", openblas_get_parallel(), openblas_get_num_threads());
 }
@@ -32,6 +32,8 @@ class OpenSSLConan(ConanFile):
         "capieng_dialog": [True, False],
         "enable_capieng": [True, False],
         "enable_trace": [True, False],
+        "enable_ktls": [True, False],
+        "enable_ec_nistp_64_gcc_128": [True, False],
         "no_aria": [True, False],
         "no_apps": [True, False],
         "no_autoload_config": [True, False],
@@ -109,6 +111,13 @@ class OpenSSLConan(ConanFile):
     def _use_nmake(self):
         return self._is_clang_cl or is_msvc(self)
 
+    @property
+    def _supports_ec_nistp_64_gcc_128(self):
+        # https://github.com/openssl/openssl/blob/openssl-3.0.0/INSTALL.md#enable-ec_nistp_64_gcc_128
+        return self.settings.arch in ["x86_64", "armv8", "armv8.3", "ppc64le"] and \
+               self.settings.compiler in ["gcc", "clang", "apple-clang"] and \
+               not self._is_clang_cl
+
     def config_options(self):
         if self.settings.os != "Windows":
             self.options.rm_safe("capieng_dialog")
@@ -132,6 +141,12 @@ class OpenSSLConan(ConanFile):
     def validate(self):
         if self.settings.os == "iOS" and self.options.shared:
             raise ConanInvalidConfiguration("OpenSSL 3 does not support building shared libraries for iOS")
+        if self.options.enable_ktls and self.settings.os != "Linux":
+            raise ConanInvalidConfiguration("The option 'enable_ktls' is only supported on Linux")
+        if self.options.enable_ec_nistp_64_gcc_128 and not self._supports_ec_nistp_64_gcc_128:
+            raise ConanInvalidConfiguration(
+                "The option 'enable_ec_nistp_64_gcc_128' requires a little-endian 64-bit target "
+                "and a GCC-compatible compiler providing __uint128_t")
 
     def build_requirements(self):
         if self.settings_build.os == "Windows":
@@ -374,6 +389,9 @@ class OpenSSLConan(ConanFile):
         if self.options.get_safe("enable_trace"):
             args.append("enable-trace")
 
+        if self.options.enable_ec_nistp_64_gcc_128:
+            args.append("enable-ec_nistp_64_gcc_128")
+
         if self.settings.os == "Neutrino":
             args.append("no-asm -lsocket -latomic")
 
@@ -406,7 +424,7 @@ class OpenSSLConan(ConanFile):
             ])
 
         for option_name in self.default_options.keys():
-            if self.options.get_safe(option_name, False) and option_name not in ("shared", "fPIC", "openssldir", "tls_security_level", "capieng_dialog", "enable_capieng", "zlib", "no_fips", "no_md2"):
+            if self.options.get_safe(option_name, False) and option_name not in ("shared", "fPIC", "openssldir", "tls_security_level", "capieng_dialog", "enable_capieng", "zlib", "no_fips", "no_md2", "enable_ec_nistp_64_gcc_128"):
                 self.output.info(f"Activated option: {option_name}")
                 args.append(option_name.replace("_", "-"))
         return args
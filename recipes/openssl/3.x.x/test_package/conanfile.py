@@ -25,6 +25,7 @@ class TestPackageConan(ConanFile):
         tc.cache_variables["OPENSSL_WITH_LEGACY"] = self._with_legacy()
         tc.cache_variables["OPENSSL_WITH_MD4"] = not self.dependencies["openssl"].options.no_md4
         tc.cache_variables["OPENSSL_WITH_RIPEMD160"] = not self.dependencies["openssl"].options.no_rmd160
+        tc.cache_variables["OPENSSL_WITH_KTLS"] = bool(self.dependencies["openssl"].options.enable_ktls)
         tc.generate()
 
     def build(self):
@@ -36,3 +37,7 @@ class TestPackageConan(ConanFile):
         if can_run(self):
             bin_path = os.path.join(self.cpp.build.bindirs[0], "test_package")
             self.run(bin_path, env="conanrun")
+            openssl_options = self.dependencies["openssl"].options
+            if openssl_options.enable_ec_nistp_64_gcc_128 and not openssl_options.no_apps:
+                # ECDH throughput with the 64-bit NIST P-256 implementation
+                self.run("openssl speed -seconds 1 ecdhp256", env="conanrun")
@@ -0,0 +1,204 @@
+#include <openssl/bio.h>
+#include <openssl/err.h>
+#include <openssl/evp.h>
+#include <openssl/ssl.h>
+#include <openssl/x509.h>
+
+#include <arpa/inet.h>
+#include <fcntl.h>
+#include <netinet/in.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/socket.h>
+#include <unistd.h>
+
+#define PAYLOAD_SIZE 16384
+
+/* Connected TCP sockets over loopback: kTLS needs TCP, AF_UNIX pairs are not enough */
+static int tcp_loopback_pair(int fds[2])
+{
+    struct sockaddr_in addr;
+    socklen_t addr_len = sizeof(addr);
+    int listener = socket(AF_INET, SOCK_STREAM, 0);
+
+    if (listener < 0)
+        return 0;
+    memset(&addr, 0, sizeof(addr));
+    addr.sin_family = AF_INET;
+    addr.sin_addr.s_addr = htonl(INADDR_LOOPBACK);
+    addr.sin_port = 0;
+    if (bind(listener, (struct sockaddr *)&addr, sizeof(addr)) != 0 ||
+        listen(listener, 1) != 0 ||
+        getsockname(listener, (struct sockaddr *)&addr, &addr_len) != 0) {
+        close(listener);
+        return 0;
+    }
+    fds[0] = socket(AF_INET, SOCK_STREAM, 0);
+    if (fds[0] < 0 || connect(fds[0], (struct sockaddr *)&addr, sizeof(addr)) != 0) {
+        close(listener);
+        return 0;
+    }
+    fds[1] = accept(listener, NULL, NULL);
+    close(listener);
+    if (fds[1] < 0)
+        return 0;
+    fcntl(fds[0], F_SETFL, fcntl(fds[0], F_GETFL) | O_NONBLOCK);
+    fcntl(fds[1], F_SETFL, fcntl(fds[1], F_GETFL) | O_NONBLOCK);
+    return 1;
+}
+
+static int self_signed_certificate(EVP_PKEY **pkey, X509 **cert)
+{
+    X509_NAME *name;
+
+    *pkey = EVP_PKEY_Q_keygen(NULL, NULL, "EC", "P-256");
+    *cert = X509_new();
+    if (*pkey == NULL || *cert == NULL)
+        return 0;
+    ASN1_INTEGER_set(X509_get_serialNumber(*cert), 1);
+    X509_gmtime_adj(X509_getm_notBefore(*cert), 0);
+    X509_gmtime_adj(X509_getm_notAfter(*cert), 3600);
+    X509_set_pubkey(*cert, *pkey);
+    name = X509_get_subject_name(*cert);
+    X509_NAME_add_entry_by_txt(name, "CN", MBSTRING_ASC, (const unsigned char *)"localhost", -1, -1, 0);
+    X509_set_issuer_name(*cert, name);
+    return X509_sign(*cert, *pkey, EVP_sha256()) > 0;
+}
+
+static int is_retryable(SSL *ssl, int ret)
+{
+    int err = SSL_get_error(ssl, ret);
+    return err == SSL_ERROR_WANT_READ || err == SSL_ERROR_WANT_WRITE;
+}
+
+static int handshake(SSL *client, SSL *server)
+{
+    int client_done = 0, server_done = 0, i, ret;
+
+    for (i = 0; i < 1000000 && !(client_done && server_done); ++i) {
+        if (!client_done) {
+            ret = SSL_do_handshake(client);
+            if (ret == 1)
+                client_done = 1;
+            else if (!is_retryable(client, ret))
+                return 0;
+        }
+        if (!server_done) {
+            ret = SSL_do_handshake(server);
+            if (ret == 1)
+                server_done = 1;
+            else if (!is_retryable(server, ret))
+                return 0;
+        }
+    }
+    return client_done && server_done;
+}
+
+/* Send a file through SSL_sendfile() and read it back on the client side */
+static int sendfile_roundtrip(SSL *client, SSL *server)
+{
+    char path[] = "/tmp/test_package_ktls_XXXXXX";
+    unsigned char payload[PAYLOAD_SIZE], received[PAYLOAD_SIZE];
+    size_t total = 0;
+    ossl_ssize_t sent;
+    int fd, i, ret, ok = 0;
+
+    for (i = 0; i < PAYLOAD_SIZE; ++i)
+        payload[i] = (unsigned char)i;
+    fd = mkstemp(path);
+    if (fd < 0)
+        return 0;
+    unlink(path);
+    if (write(fd, payload, PAYLOAD_SIZE) != PAYLOAD_SIZE)
+        goto end;
+
+    sent = SSL_sendfile(server, fd, 0, PAYLOAD_SIZE, 0);
+    if (sent != PAYLOAD_SIZE) {
+        printf("SSL_sendfile() sent %ld of %d bytes\n", (long)sent, PAYLOAD_SIZE);
+        goto end;
+    }
+    for (i = 0; i < 1000000 && total < PAYLOAD_SIZE; ++i) {
+        ret = SSL_read(client, received + total, (int)(PAYLOAD_SIZE - total));
+        if (ret > 0)
+            total += (size_t)ret;
+        else if (!is_retryable(client, ret))
+            goto end;
+    }
+    ok = total == PAYLOAD_SIZE && memcmp(payload, received, PAYLOAD_SIZE) == 0;
+
+end:
+    close(fd);
+    return ok;
+}
+
+int test_ktls()
+{
+    SSL_CTX *client_ctx = NULL, *server_ctx = NULL;
+    SSL *client = NULL, *server = NULL;
+    EVP_PKEY *pkey = NULL;
+    X509 *cert = NULL;
+    int fds[2] = {-1, -1};
+    int result = 1;
+
+    if (!tcp_loopback_pair(fds)) {
+        printf("kTLS: loopback sockets unavailable, skipping\n");
+        return 0;
+    }
+    if (!self_signed_certificate(&pkey, &cert))
+        goto end;
+
+    client_ctx = SSL_CTX_new(TLS_client_method());
+    server_ctx = SSL_CTX_new(TLS_server_method());
+    if (client_ctx == NULL || server_ctx == NULL)
+        goto end;
+    SSL_CTX_set_options(client_ctx, SSL_OP_ENABLE_KTLS);
+    SSL_CTX_set_options(server_ctx, SSL_OP_ENABLE_KTLS);
+    if (SSL_CTX_use_certificate(server_ctx, cert) != 1 || SSL_CTX_use_PrivateKey(server_ctx, pkey) != 1)
+        goto end;
+
+    client = SSL_new(client_ctx);
+    server = SSL_new(server_ctx);
+    if (client == NULL || server == NULL)
+        goto end;
+    SSL_set_fd(client, fds[0]);
+    SSL_set_fd(server, fds[1]);
+    SSL_set_connect_state(client);
+    SSL_set_accept_state(server);
+
+    if (!handshake(client, server)) {
+        printf("kTLS: TLS handshake over loopback failed\n");
+        goto end;
+    }
+
+    printf("kTLS send offload: %s\n", BIO_get_ktls_send(SSL_get_wbio(server)) ? "active" : "inactive");
+    printf("kTLS receive offload: %s\n", BIO_get_ktls_recv(SSL_get_rbio(client)) ? "active" : "inactive");
+
+    if (!BIO_get_ktls_send(SSL_get_wbio(server))) {
+        /* The kernel may lack the tls module; the library itself is fine */
+        printf("kTLS: not available in the running kernel, skipping SSL_sendfile()\n");
+        result = 0;
+        goto end;
+    }
+    if (!sendfile_roundtrip(client, server)) {
+        printf("kTLS: SSL_sendfile() round trip failed\n");
+        goto end;
+    }
+    printf("kTLS: SSL_sendfile() round trip succeeded\n");
+    result = 0;
+
+end:
+    if (result != 0)
+        ERR_print_errors_fp(stdout);
+    SSL_free(client);
+    SSL_free(server);
+    SSL_CTX_free(client_ctx);
+    SSL_CTX_free(server_ctx);
+    X509_free(cert);
+    EVP_PKEY_free(pkey);
+    if (fds[0] >= 0)
+        close(fds[0]);
+    if (fds[1] >= 0)
+        close(fds[1]);
+    return result;
+}
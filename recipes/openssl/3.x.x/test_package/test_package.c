@@ -3,10 +3,12 @@
 
 void digest();
 int digest_legacy();
+int test_ktls();
 
 int main()
 {
 	int legacy_result = 0;
+	int ktls_result = 0;
 	OPENSSL_init_ssl(0, NULL);
 	printf("OpenSSL version: %s\n", OpenSSL_version(OPENSSL_VERSION));
 	
@@ -20,5 +22,13 @@ int main()
 	}
 #endif
 
+#if defined(TEST_OPENSSL_KTLS)
+	ktls_result = test_ktls();
+	if (ktls_result != 0) {
+		printf("Error testing kernel TLS offload\n");
+		return 1;
+	}
+#endif
+
 	return 0;
 }
@@ -26,18 +26,48 @@ class PixmanConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "mmx": ["auto", "enabled", "disabled"],
+        "sse2": ["auto", "enabled", "disabled"],
+        "ssse3": ["auto", "enabled", "disabled"],
+        "vmx": ["auto", "enabled", "disabled"],
+        "arm_simd": ["auto", "enabled", "disabled"],
+        "neon": ["auto", "enabled", "disabled"],
+        "a64_neon": ["auto", "enabled", "disabled"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "mmx": "auto",
+        "sse2": "auto",
+        "ssse3": "auto",
+        "vmx": "auto",
+        "arm_simd": "auto",
+        "neon": "auto",
+        "a64_neon": "auto",
     }
 
+    @property
+    def _simd_options(self):
+        # SIMD meson features of pixman, and the architectures they apply to
+        return {
+            "mmx": ["x86", "x86_64"],
+            "sse2": ["x86", "x86_64"],
+            "ssse3": ["x86", "x86_64"],
+            "vmx": ["ppc32", "ppc32be", "ppc64", "ppc64le"],
+            "arm_simd": ["armv6", "armv7", "armv7hf", "armv7s", "armv7k"],
+            "neon": ["armv7", "armv7hf", "armv7s", "armv7k"],
+            "a64_neon": ["armv8", "armv8.3"],
+        }
+
     def export_sources(self):
         export_conandata_patches(self)
 
     def config_options(self):
         if self.settings.os == "Windows":
             del self.options.fPIC
+        for option, archs in self._simd_options.items():
+            if str(self.settings.arch) not in archs:
+                self.options.rm_safe(option)
 
     def configure(self):
         if self.options.shared:
@@ -60,8 +90,13 @@ class PixmanConan(ConanFile):
         tc = MesonToolchain(self)
         tc.project_options.update({
             "libpng": "disabled",
-            "gtk": "disabled"
+            "gtk": "disabled",
+            # OpenMP is only used by the tests, which are not built
+            "openmp": "disabled",
         })
+        for option in self._simd_options:
+            if self.options.get_safe(option):
+                tc.project_options[option.replace("_", "-")] = str(self.options.get_safe(option))
 
         # Android armv7 build of Pixman makes use of cpu-features functionality, provided in the NDK
         if self.settings.os == "Android":
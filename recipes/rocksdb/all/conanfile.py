@@ -32,6 +32,9 @@ class RocksDBConan(ConanFile):
         "with_tbb": [True, False],
         "with_folly": [True, False],
         "with_jemalloc": [True, False],
+        "with_liburing": [True, False],
+        "with_numa": [True, False],
+        "build_tools": [True, False],
         "enable_sse": [False, "sse42", "avx2"],
         "use_rtti": [True, False],
     }
@@ -46,6 +49,9 @@ class RocksDBConan(ConanFile):
         "with_tbb": False,
         "with_jemalloc": False,
         "with_folly": False,
+        "with_liburing": False,
+        "with_numa": False,
+        "build_tools": False,
         "enable_sse": False,
         "use_rtti": False,
     }
@@ -58,6 +64,9 @@ class RocksDBConan(ConanFile):
             del self.options.fPIC
         if self.settings.arch != "x86_64":
             del self.options.with_tbb
+        if self.settings.os != "Linux":
+            del self.options.with_liburing
+            del self.options.with_numa
         if self.settings.build_type == "Debug":
             self.options.use_rtti = True  # Rtti are used in asserts for debug mode...
 
@@ -85,6 +94,10 @@ class RocksDBConan(ConanFile):
             self.requires("jemalloc/5.3.0")
         if self.options.with_folly:
             self.requires("folly/2024.08.12.00")
+        if self.options.get_safe("with_liburing"):
+            self.requires("liburing/2.11")
+        if self.options.get_safe("with_numa"):
+            self.requires("libnuma/2.0.19")
 
     def validate(self):
         check_min_cppstd(self, 17)
@@ -99,6 +112,10 @@ class RocksDBConan(ConanFile):
             # https://github.com/facebook/rocksdb/blob/v10.5.1/CMakeLists.txt#L603
             raise ConanInvalidConfiguration(f"{self.ref} does not support a shared build with folly")
 
+        if self.options.build_tools and not self.options.with_gflags:
+            # db_bench, ldb and sst_dump parse their command line with gflags
+            raise ConanInvalidConfiguration(f"{self.ref} requires with_gflags=True when build_tools=True")
+
     def _patch_sources(self):
         # INFO: Avoid enforcing all linkers to use copy-dt-needed-entries
         # https://github.com/facebook/rocksdb/issues/13895
@@ -115,8 +132,8 @@ class RocksDBConan(ConanFile):
         tc.variables["FAIL_ON_WARNINGS"] = False
         tc.variables["WITH_TESTS"] = False
         tc.variables["WITH_TOOLS"] = False
-        tc.variables["WITH_CORE_TOOLS"] = False
-        tc.variables["WITH_BENCHMARK_TOOLS"] = False
+        tc.variables["WITH_CORE_TOOLS"] = self.options.build_tools
+        tc.variables["WITH_BENCHMARK_TOOLS"] = self.options.build_tools
         tc.variables["USE_FOLLY"] = self.options.with_folly
         if is_msvc(self):
             tc.variables["WITH_MD_LIBRARY"] = not is_msvc_static_runtime(self)
@@ -128,6 +145,8 @@ class RocksDBConan(ConanFile):
         tc.variables["WITH_ZSTD"] = self.options.with_zstd
         tc.variables["WITH_TBB"] = self.options.get_safe("with_tbb", False)
         tc.variables["WITH_JEMALLOC"] = self.options.with_jemalloc
+        # Enabled by default upstream on Linux, would pick up a system liburing
+        tc.variables["WITH_LIBURING"] = self.options.get_safe("with_liburing", False)
 
         tc.variables["ROCKSDB_BUILD_SHARED"] = self.options.shared
         tc.variables["ROCKSDB_LIBRARY_EXPORTS"] = self.settings.os == "Windows" and self.options.shared
@@ -142,8 +161,7 @@ class RocksDBConan(ConanFile):
         elif self.options.enable_sse == "avx2":
             tc.variables["PORTABLE"] = False
             tc.variables["FORCE_SSE42"] = False
-        # not available yet in CCI
-        tc.variables["WITH_NUMA"] = False
+        tc.variables["WITH_NUMA"] = self.options.get_safe("with_numa", False)
         tc.generate()
 
         deps = CMakeDeps(self)
@@ -154,6 +172,12 @@ class RocksDBConan(ConanFile):
             deps.set_property("zstd", "cmake_target_name", "zstd::zstd")
         if self.options.with_folly:
             deps.set_property("folly", "cmake_additional_variables_prefixes", ["FOLLY",])
+        if self.options.get_safe("with_liburing"):
+            deps.set_property("liburing", "cmake_file_name", "uring")
+            deps.set_property("liburing", "cmake_target_name", "uring::uring")
+        if self.options.get_safe("with_numa"):
+            deps.set_property("libnuma", "cmake_file_name", "NUMA")
+            deps.set_property("libnuma", "cmake_target_name", "NUMA::NUMA")
         deps.generate()
 
     def build(self):
@@ -174,6 +198,13 @@ class RocksDBConan(ConanFile):
         cmake.install()
         if self.options.shared:
             self._remove_static_libraries()
+        if self.options.build_tools:
+            # Not installed by upstream. db_bench is built in the build folder, ldb and sst_dump in
+            # tools/, and in a <build_type> subfolder with multi-config generators
+            exe_ext = ".exe" if self.settings.os == "Windows" else ""
+            for tool in ["db_bench", "ldb", "sst_dump"]:
+                for pattern in [f"{tool}{exe_ext}", f"*/{tool}{exe_ext}"]:
+                    copy(self, pattern, src=self.build_folder, dst=os.path.join(self.package_folder, "bin"), keep_path=False)
         rmdir(self, os.path.join(self.package_folder, "lib", "cmake"))
         rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
 
@@ -205,4 +236,8 @@ class RocksDBConan(ConanFile):
         if self.options.with_jemalloc:
             self.cpp_info.components["librocksdb"].requires.append("jemalloc::jemalloc")
         if self.options.with_folly:
-            self.cpp_info.components["librocksdb"].requires.append("folly::folly")
\ No newline at end of file
+            self.cpp_info.components["librocksdb"].requires.append("folly::folly")
+        if self.options.get_safe("with_liburing"):
+            self.cpp_info.components["librocksdb"].requires.append("liburing::liburing")
+        if self.options.get_safe("with_numa"):
+            self.cpp_info.components["librocksdb"].requires.append("libnuma::libnuma")
\ No newline at end of file
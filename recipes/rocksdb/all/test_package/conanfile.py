@@ -23,3 +23,7 @@ class TestPackageConan(ConanFile):
         if can_run(self):
             bin_path = os.path.join(self.cpp.build.bindir, "test_package")
             self.run(bin_path, env="conanrun")
+            if self.dependencies["rocksdb"].options.build_tools:
+                self.run("db_bench --version", env="conanrun")
+                self.run("ldb --version", env="conanrun")
+                self.run("sst_dump --help", env="conanrun")
@@ -1,11 +1,58 @@
 #include <cstdlib>
+#include <filesystem>
+#include <iostream>
+#include <string>
+#include <vector>
+
 #include "rocksdb/db.h"
 #include "rocksdb/c.h"
 
 
+static int test_multiget_async_io() {
+    const std::string path = (std::filesystem::temp_directory_path() / "rocksdb_test_package").string();
+    rocksdb::Options options;
+    options.create_if_missing = true;
+    rocksdb::DestroyDB(path, options);
+
+    rocksdb::DB *db = nullptr;
+    rocksdb::Status status = rocksdb::DB::Open(options, path, &db);
+    if (!status.ok()) {
+        std::cerr << "Open: " << status.ToString() << std::endl;
+        return EXIT_FAILURE;
+    }
+
+    const std::vector<std::string> keys = {"key1", "key2", "key3"};
+    for (const auto &key : keys) {
+        db->Put(rocksdb::WriteOptions(), key, "value_" + key);
+    }
+    // Read from SST files rather than the memtable
+    db->Flush(rocksdb::FlushOptions());
+
+    rocksdb::ReadOptions read_options;
+    // Uses io_uring when RocksDB was built with liburing, falls back to synchronous reads otherwise
+    read_options.async_io = true;
+    std::vector<rocksdb::Slice> key_slices(keys.begin(), keys.end());
+    std::vector<rocksdb::PinnableSlice> values(keys.size());
+    std::vector<rocksdb::Status> statuses(keys.size());
+    db->MultiGet(read_options, db->DefaultColumnFamily(), keys.size(), key_slices.data(), values.data(), statuses.data());
+
+    int result = EXIT_SUCCESS;
+    for (size_t i = 0; i < keys.size(); ++i) {
+        if (!statuses[i].ok() || values[i].ToString() != "value_" + keys[i]) {
+            std::cerr << "MultiGet " << keys[i] << ": " << statuses[i].ToString() << std::endl;
+            result = EXIT_FAILURE;
+        }
+    }
+
+    db->Close();
+    delete db;
+    rocksdb::DestroyDB(path, options);
+    return result;
+}
+
 int main() {
     rocksdb_options_t *options = rocksdb_options_create();
     rocksdb_free(options);
 
-    return EXIT_SUCCESS;
+    return test_multiget_async_io();
 }
@@ -48,6 +48,14 @@ class Sqlite3Conan(ConanFile):
         "build_executable": [True, False],
         "enable_default_vfs": [True, False],
         "enable_dbpage_vtab": [True, False],
+        "default_page_size": [None, "ANY"],
+        "default_cache_size": [None, "ANY"],
+        "default_mmap_size": [None, "ANY"],
+        "max_mmap_size": [None, "ANY"],
+        "default_wal_synchronous": [None, 0, 1, 2, 3],
+        "default_memstatus": [True, False],
+        "like_doesnt_match_blobs": [True, False],
+        "enable_stat4": [True, False],
     }
     default_options = {
         "shared": False,
@@ -80,6 +88,14 @@ class Sqlite3Conan(ConanFile):
         "build_executable": True,
         "enable_default_vfs": True,
         "enable_dbpage_vtab": False,
+        "default_page_size": None,      # Uses default value from source
+        "default_cache_size": None,     # Uses default value from source
+        "default_mmap_size": None,      # Uses default value from source
+        "max_mmap_size": None,          # Uses default value from source
+        "default_wal_synchronous": None,  # Same as the synchronous setting
+        "default_memstatus": True,
+        "like_doesnt_match_blobs": False,
+        "enable_stat4": False,
     }
 
     exports_sources = "CMakeLists.txt"
@@ -109,6 +125,22 @@ class Sqlite3Conan(ConanFile):
             if self.options.omit_load_extension:
                 raise ConanInvalidConfiguration("build_executable=True requires omit_load_extension=True")
 
+        for option in ("default_page_size", "default_cache_size", "default_mmap_size", "max_mmap_size"):
+            value = str(self.options.get_safe(option))
+            if value != "None" and not value.lstrip("-").isdigit():
+                raise ConanInvalidConfiguration(f"{option} must be an integer, got '{value}'")
+        if str(self.options.default_page_size) != "None":
+            page_size = int(self.options.default_page_size)
+            # https://www.sqlite.org/compile.html#default_page_size
+            if page_size < 512 or page_size > 65536 or page_size & (page_size - 1):
+                raise ConanInvalidConfiguration("default_page_size must be a power of two between 512 and 65536")
+        for option in ("default_mmap_size", "max_mmap_size"):
+            if str(self.options.get_safe(option)) != "None" and int(self.options.get_safe(option)) < 0:
+                raise ConanInvalidConfiguration(f"{option} must not be negative")
+        if str(self.options.default_mmap_size) != "None" and str(self.options.max_mmap_size) != "None":
+            if int(self.options.default_mmap_size) > int(self.options.max_mmap_size):
+                raise ConanInvalidConfiguration("default_mmap_size must not be greater than max_mmap_size")
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version], strip_root=True)
 
@@ -153,6 +185,17 @@ class Sqlite3Conan(ConanFile):
             tc.variables["MAX_BLOB_SIZE"] = self.options.max_blob_size
         tc.variables["DISABLE_DEFAULT_VFS"] = not self.options.enable_default_vfs
         tc.variables["ENABLE_DBPAGE_VTAB"] = self.options.enable_dbpage_vtab
+        # Compile-time defaults, so that connections don't need PRAGMAs on every open
+        for option, variable in [("default_page_size", "DEFAULT_PAGE_SIZE"),
+                                 ("default_cache_size", "DEFAULT_CACHE_SIZE"),
+                                 ("default_mmap_size", "DEFAULT_MMAP_SIZE"),
+                                 ("max_mmap_size", "MAX_MMAP_SIZE"),
+                                 ("default_wal_synchronous", "DEFAULT_WAL_SYNCHRONOUS")]:
+            if str(self.options.get_safe(option)) != "None":
+                tc.variables[variable] = str(self.options.get_safe(option))
+        tc.variables["DISABLE_MEMSTATUS"] = not self.options.default_memstatus
+        tc.variables["LIKE_DOESNT_MATCH_BLOBS"] = self.options.like_doesnt_match_blobs
+        tc.variables["ENABLE_STAT4"] = self.options.enable_stat4
         tc.generate()
 
     def build(self):
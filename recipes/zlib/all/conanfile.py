@@ -1,6 +1,9 @@
 from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
+from conan.tools.apple import fix_apple_shared_install_name
 from conan.tools.cmake import CMake, CMakeToolchain, cmake_layout
-from conan.tools.files import apply_conandata_patches, export_conandata_patches, get, load, replace_in_file, save
+from conan.tools.files import apply_conandata_patches, copy, export_conandata_patches, get, load, replace_in_file, rmdir, save
+from conan.tools.microsoft import is_msvc
 from conan.tools.scm import Version
 import os
 
@@ -21,12 +24,22 @@ class ZlibConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "implementation": ["reference", "zlib-ng-compat"],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "implementation": "reference",
     }
 
+    @property
+    def _is_zlib_ng(self):
+        return self.options.implementation == "zlib-ng-compat"
+
+    @property
+    def _zlib_ng_source_folder(self):
+        return os.path.join(self.build_folder, "zlib-ng-src")
+
     def export_sources(self):
         export_conandata_patches(self)
 
@@ -43,11 +56,32 @@ class ZlibConan(ConanFile):
     def layout(self):
         cmake_layout(self, src_folder="src")
 
+    def validate(self):
+        if self._is_zlib_ng and self.version not in self.conan_data["zlib_ng_sources"]:
+            raise ConanInvalidConfiguration(
+                f"{self.ref} has no API-compatible zlib-ng release, use implementation=reference")
+
     def source(self):
         get(self, **self.conan_data["sources"][self.version],
             destination=self.source_folder, strip_root=True)
 
+    def _generate_zlib_ng(self):
+        # Same configuration as the zlib-ng recipe with zlib_compat=True
+        tc = CMakeToolchain(self)
+        tc.variables["ZLIB_ENABLE_TESTS"] = False
+        tc.variables["ZLIBNG_ENABLE_TESTS"] = False
+        tc.variables["ZLIB_COMPAT"] = True
+        tc.variables["WITH_GZFILEOP"] = True
+        tc.variables["WITH_OPTIM"] = True
+        tc.variables["WITH_NEW_STRATEGIES"] = True
+        tc.variables["WITH_NATIVE_INSTRUCTIONS"] = False
+        tc.variables["WITH_RUNTIME_CPU_DETECTION"] = True
+        tc.generate()
+
     def generate(self):
+        if self._is_zlib_ng:
+            self._generate_zlib_ng()
+            return
         tc = CMakeToolchain(self)
         tc.variables["SKIP_INSTALL_ALL"] = False
         tc.variables["SKIP_INSTALL_LIBRARIES"] = False
@@ -76,9 +110,14 @@ class ZlibConan(ConanFile):
                                       '#if defined(HAVE_STDARG_H) && (1-HAVE_STDARG_H-1 != 0)')
 
     def build(self):
-        self._patch_sources()
         cmake = CMake(self)
-        cmake.configure()
+        if self._is_zlib_ng:
+            get(self, **self.conan_data["zlib_ng_sources"][self.version],
+                destination=self._zlib_ng_source_folder, strip_root=True)
+            cmake.configure(build_script_folder=self._zlib_ng_source_folder)
+        else:
+            self._patch_sources()
+            cmake.configure()
         cmake.build()
 
     def _extract_license(self):
@@ -87,9 +126,17 @@ class ZlibConan(ConanFile):
         return license_contents
 
     def package(self):
-        save(self, os.path.join(self.package_folder, "licenses", "LICENSE"), self._extract_license())
+        if self._is_zlib_ng:
+            copy(self, "LICENSE.md", src=self._zlib_ng_source_folder, dst=os.path.join(self.package_folder, "licenses"))
+        else:
+            save(self, os.path.join(self.package_folder, "licenses", "LICENSE"), self._extract_license())
         cmake = CMake(self)
         cmake.install()
+        if self._is_zlib_ng:
+            rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
+            rmdir(self, os.path.join(self.package_folder, "lib", "cmake"))
+            # upstream CMakeLists hardcodes install_name with full install path
+            fix_apple_shared_install_name(self)
 
     def package_info(self):
         self.cpp_info.set_property("cmake_find_mode", "both")
@@ -97,7 +144,17 @@ class ZlibConan(ConanFile):
         self.cpp_info.set_property("cmake_target_name", "ZLIB::ZLIB")
         self.cpp_info.set_property("pkg_config_name", "zlib")
 
-        if self.settings.os == "Windows" and self.settings.get_safe("compiler.runtime"):
+        if self._is_zlib_ng:
+            if self.settings.os in ["Windows", "WindowsStore"]:
+                # https://github.com/zlib-ng/zlib-ng/blob/2.0.4/CMakeLists.txt#L994-L1016
+                base = "zlib" if is_msvc(self) or self.options.shared else "z"
+                static_flag = "static" if is_msvc(self) and not self.options.shared else ""
+                build_type = "d" if self.settings.build_type == "Debug" else ""
+                libname = f"{base}{static_flag}{build_type}"
+            else:
+                libname = "z"
+            self.cpp_info.defines = ["ZLIB_COMPAT", "WITH_GZFILEOP"]
+        elif self.settings.os == "Windows" and self.settings.get_safe("compiler.runtime"):
             # The recipe patches the CMakeLists.txt to generate different filenames when CMake
             # detects MINGW (clang, gcc with compiler.runtime undefined and compiler.libcxx defined)
             libname = "zdll" if self.options.shared else "zlib"